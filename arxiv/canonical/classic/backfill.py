@@ -715,7 +715,8 @@ def _make_id(event_datum: daily.EventData,
             current[event_datum.arxiv_id] + 1
         )
     else:
-        print(event_datum.event_type)
+        logger.debug('Event %s applies to current version of %s',
+                     event_datum.event_type, event_datum.arxiv_id)
         identifier = VersionedIdentifier.from_parts(
             event_datum.arxiv_id,
             current[event_datum.arxiv_id]
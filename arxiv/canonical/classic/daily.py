@@ -336,8 +336,7 @@ class OldStyleLineParser(LineParser):
             start_id = int(match_range.group('start_id'))
             end_id = int(match_range.group('end_id'))
             for _identifier in range(start_id, end_id + 1):  # Inclusive.
-                identifier = str(_identifier).zfill(7)
-                paper_id = f'{archive}/{identifier}'
+                paper_id = f'{archive}/{_identifier:07d}'
                 try:
                     yield Identifier(paper_id), EventType.NEW, archive
                 except InvalidIdentifier as e:
@@ -2,8 +2,8 @@
 
 import io
 import datetime
-from typing import Any, Callable, Dict, IO, Iterable, List, Sequence, Tuple, Type, \
-    TypeVar, Union
+from typing import Any, Callable, Dict, IO, Iterable, List, Sequence, \
+    Tuple, Type, TypeVar, Union
 
 from typing_extensions import Protocol
 
@@ -41,7 +41,14 @@ class IEventStream(Protocol):
 
 
 class ICanonicalSource(Protocol):
-    """Interface for source services, used to dereference URIs."""
+    """
+    Interface for source services, used to dereference URIs.
+
+    Implementations may also advertise the URI schemes that they are able to
+    resolve via a ``schemes`` attribute (a collection of str). This allows a
+    :class:`.Resolver` to skip over sources that could never resolve an URI.
+    Sources without a ``schemes`` attribute are considered for all URIs.
+    """
 
     def can_resolve(self, uri: D.URI) -> bool:
         """
@@ -69,7 +76,9 @@ class ICanonicalSource(Protocol):
         -------
         IO
             Yields bytes when read. This may be a lazy IO object, so that
-            reading is deferred until the latest possible time.
+            reading is deferred until the latest possible time. Raw
+            (unbuffered) IO objects are buffered by :func:`.dereference`, so
+            implementations need not buffer them themselves.
 
         """
 
@@ -243,6 +252,89 @@ class IPreservationAPI(Protocol):
         """Load the preservation package for a particular date."""
 
 
+READ_BUFFER_SIZE = 65_536
+"""Size of the buffer used for unbuffered streams returned by sources."""
+
+
+def _buffered(content: IO[bytes]) -> IO[bytes]:
+    """
+    Wrap an unbuffered stream in a :class:`io.BufferedReader`.
+
+    This coalesces small reads (e.g. when hashing or copying a stream) into
+    fewer reads against the underlying resource. Streams that are already
+    buffered (or in memory) are returned as-is.
+    """
+    if isinstance(content, io.RawIOBase):
+        return io.BufferedReader(content, buffer_size=READ_BUFFER_SIZE)
+    return content
+
+
+_Candidate = Tuple[ICanonicalSource, Callable[[D.URI], bool]]
+
+
+class Resolver(Sequence[ICanonicalSource]):
+    """
+    A sequence of sources that routes URIs to sources by scheme.
+
+    Behaves like the sequence of sources with which it was created, so it can
+    be passed anywhere that ``Sequence[ICanonicalSource]`` is expected. When
+    passed to :func:`dereference`, sources are only checked if they can
+    resolve the scheme of the URI.
+
+    Which of those sources resolves a given URI is not remembered, since that
+    can change over time (e.g. a storage source can resolve a key only once
+    something has been stored there).
+    """
+
+    def __init__(self, sources: Iterable[ICanonicalSource]) -> None:
+        """Initialize with a set of available sources."""
+        self._sources = tuple(sources)
+        self._by_scheme: Dict[str, Tuple[_Candidate, ...]] = {}
+
+    def __getitem__(self, index: Any) -> Any:
+        """Get a source by its position."""
+        return self._sources[index]
+
+    def __len__(self) -> int:
+        """Get the number of available sources."""
+        return len(self._sources)
+
+    def _candidates(self, scheme: str) -> Tuple[_Candidate, ...]:
+        """
+        Get the sources that might resolve URIs with ``scheme``, in order.
+
+        Each source is paired with its bound ``can_resolve`` method, so that
+        it need not be looked up again for every URI.
+        """
+        candidates = self._by_scheme.get(scheme)
+        if candidates is None:
+            candidates = tuple(
+                (source, source.can_resolve) for source in self._sources
+                if getattr(source, 'schemes', None) is None
+                or scheme in getattr(source, 'schemes')
+            )
+            self._by_scheme[scheme] = candidates
+        return candidates
+
+    def _find_source(self, uri: D.URI) -> ICanonicalSource:
+        for source, can_resolve in self._candidates(uri.scheme):
+            if can_resolve(uri):
+                return source
+        raise RuntimeError(f'Cannot resolve URI: {uri}')
+
+    def dereference(self, uri: D.URI) -> IO[bytes]:
+        """
+        Dereference an URI using the first source that can resolve it.
+
+        Raises
+        ------
+        :class:`RuntimeError`
+            Raised when the URI cannot be resolved.
+
+        """
+        return _buffered(self._find_source(uri).load(uri))
+
+
 # TODO: consider a semantically more meaningful exception for failure to
 # dereference the URI.
 def dereference(sources: Sequence[ICanonicalSource], uri: D.URI) -> IO[bytes]:
@@ -257,6 +349,8 @@ def dereference(sources: Sequence[ICanonicalSource], uri: D.URI) -> IO[bytes]:
     sources : sequence
         Items are content sources that should conform to
         :class:`.ICanonicalSource`. They will be tried in the order provided.
+        If this is a :class:`.Resolver`, only sources that advertise the
+        scheme of ``uri`` (or that do not advertise any schemes) are tried.
     uri : :class:`.URI`
         URI to dereference.
 
@@ -271,7 +365,9 @@ def dereference(sources: Sequence[ICanonicalSource], uri: D.URI) -> IO[bytes]:
         Raised when the URI cannot be resolved.
 
     """
+    if isinstance(sources, Resolver):
+        return sources.dereference(uri)
     for source in sources:
         if source.can_resolve(uri):
-            return source.load(uri)
-    raise RuntimeError(f'Cannot resolve URI: {uri}')
\ No newline at end of file
+            return _buffered(source.load(uri))
+    raise RuntimeError(f'Cannot resolve URI: {uri}')
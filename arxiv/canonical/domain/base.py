@@ -8,6 +8,8 @@ from typing_extensions import Protocol, runtime_checkable
 class CanonicalBase:
     """Base class for all canonical domain classes."""
 
+    __slots__ = ()
+
     exclude_from_comparison: Set[str] = set()
     """Names of attributes not to be used in __eq__ comparisons."""
 
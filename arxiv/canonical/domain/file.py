@@ -1,9 +1,11 @@
 """Provides bitstream-related concepts and logic."""
 
-import os
 from datetime import datetime
-from typing import Any, Dict, IO, Iterable, NamedTuple, Optional, Union
-from urllib.parse import urlparse
+from functools import lru_cache
+from typing import Any, Dict, IO, Iterable, List, NamedTuple, Optional, \
+    Tuple, Union
+from urllib.parse import ParseResult, urlparse
+from weakref import WeakValueDictionary
 
 from typing_extensions import Protocol
 
@@ -11,6 +13,56 @@ from .base import CanonicalBase
 from .content import ContentType
 
 
+_FAST_SCHEMES = frozenset({'arxiv', 'file', 'http', 'https'})
+"""Schemes that are handled by :func:`_fast_split`."""
+
+
+def _fast_split(value: str) -> ParseResult:
+    """
+    Split a URI with one of the schemes that we use all the time.
+
+    This is a lot cheaper than :func:`urlparse`, which has to cope with
+    params, userinfo, IPv6 hosts, etc. Anything that we don't recognize is
+    handed off to :func:`urlparse`.
+    """
+    scheme, sep, rest = value.partition('://')
+    scheme = scheme.lower()
+    if not sep or scheme not in _FAST_SCHEMES or ';' in rest:
+        return urlparse(value)
+    rest, _, fragment = rest.partition('#')
+    rest, _, query = rest.partition('?')
+    netloc, slash, path = rest.partition('/')
+    return ParseResult(scheme, netloc, slash + path, '', query, fragment)
+
+
+@lru_cache(maxsize=4096)
+def _parse(value: str) -> ParseResult:
+    """
+    Parse a (normalized) URI string.
+
+    The same URIs are constructed over and over again during deserialization
+    (keys, refs), so we hang on to the parsed components.
+    """
+    return _fast_split(value)
+
+
+@lru_cache(maxsize=8192)
+def _parse_datetime(value: str) -> datetime:
+    """
+    Parse an ISO-8601 datetime.
+
+    Files that are loaded in bulk often share timestamps, and datetimes are
+    immutable, so parsed values are shared.
+    """
+    return datetime.fromisoformat(value)  # type: ignore ; pylint: disable=no-member
+
+
+@lru_cache(maxsize=64)
+def _content_type(value: str) -> ContentType:
+    """Get a :class:`.ContentType` by value."""
+    return ContentType(value)
+
+
 class URI(str):
     """
     A unique identifier for bitstream content.
@@ -20,65 +72,133 @@ class URI(str):
     or at a remote location accessible via HTTP.
     """
 
+    __slots__ = ('scheme', 'is_canonical', 'is_file', 'is_http_url',
+                 '_normalized', '_parsed', '__weakref__')
+
+    _instances: 'WeakValueDictionary[Tuple[type, str], URI]' \
+        = WeakValueDictionary()
+    """
+    URIs that are currently in use, so that duplicates can be shared.
+
+    URIs are effectively immutable, and the same URIs (e.g. refs repeated
+    across versions of an e-print) tend to be constructed many times.
+    """
+
+    _normalized: str
+    _parsed: Optional[ParseResult]
+
+    scheme: str
+    """The URI scheme, e.g. ``arxiv`` or ``https``."""
+
+    is_canonical: bool
+    """Indicates whether the URI is a key in the canonical record."""
+
+    is_file: bool
+    """Indicates whether the URI is a path to a local file."""
+
+    is_http_url: bool
+    """Indicates whether the URI is an HTTP URL."""
+
     def __new__(cls, value: str) -> 'URI':
         """Make a new URI."""
-        if value.startswith('/'):
-            value = f'file:///{value.lstrip("/")}'
-        uri: URI = super(URI, cls).__new__(cls, value)  # type: ignore
+        normalized = cls._normalize(value)
+        uri = URI._instances.get((cls, normalized))
+        if uri is None:
+            uri = super(URI, cls).__new__(cls, normalized)  # type: ignore
+            uri._normalized = normalized
+            uri._parsed = None
         return uri
 
     def __init__(self, value: str) -> None:
-        """Initialize and parse an URI from a str value."""
-        if value.startswith('/'):
-            value = f'file:///{value.lstrip("/")}'
+        """
+        Initialize an URI from a str value.
 
-        o = urlparse(value)
-        self.scheme = o.scheme
-        if not self.scheme:
+        Only the scheme is extracted here; the remaining components are parsed
+        the first time that they are accessed. The URI is shared with later
+        callers only once it is known to be valid.
+        """
+        if hasattr(self, 'scheme'):     # This is a shared instance.
+            return
+        value = self._normalized
+        scheme, sep, _ = value.partition('://')
+        if not sep or scheme not in _FAST_SCHEMES:
+            scheme = self._components.scheme
+        if not scheme:
             raise ValueError(f'Not a valid URI: {value}')
-        self.netloc = o.netloc
-        self.path = o.path
-        self.params = o.params
-        self.query = o.query
-        self.fragment = o.fragment
+        self.scheme = scheme
+        self.is_canonical = self.scheme == 'arxiv'
+        self.is_file = self.scheme == 'file'
+        self.is_http_url = self.scheme == 'http' or self.scheme == 'https'
+        URI._instances[(type(self), value)] = self
 
     @property
-    def is_canonical(self) -> bool:
-        """Indicate whether the URI is a key in the canonical record."""
-        return bool(self.scheme == 'arxiv')
+    def _components(self) -> ParseResult:
+        if self._parsed is None:
+            self._parsed = _parse(self._normalized)
+        return self._parsed
 
     @property
-    def is_file(self) -> bool:
-        """Indicate whether the URI is a path to a local file."""
-        return bool(self.scheme == 'file')
+    def netloc(self) -> str:
+        """Network location part of the URI."""
+        return self._components.netloc
 
     @property
-    def is_http_url(self) -> bool:
-        """Indicate whether the URI is an HTTP URL."""
-        return bool(self.scheme == 'http' or self.scheme == 'https')
+    def path(self) -> str:
+        """Hierarchical path part of the URI."""
+        return self._components.path
+
+    @property
+    def params(self) -> str:
+        """Parameters for the last element of the path."""
+        return self._components.params
+
+    @property
+    def query(self) -> str:
+        """Query part of the URI."""
+        return self._components.query
+
+    @property
+    def fragment(self) -> str:
+        """Fragment identifier part of the URI."""
+        return self._components.fragment
+
+    @staticmethod
+    def _normalize(value: str) -> str:
+        """Rewrite absolute paths as ``file://`` URIs."""
+        if value.startswith('/'):
+            value = f'file:///{value.lstrip("/")}'
+        return value
 
 
 class Key(URI):
     """The unique identifier for a bitstream in the canonical record."""
 
-    def __new__(cls, value: str) -> 'Key':
-        """Make a new key."""
-        if not value.startswith('arxiv:///'):
-            value = f'arxiv:///{value.lstrip("/")}'
-        key: Key = super(Key, cls).__new__(cls, value)  # type: ignore
-        return key
+    __slots__ = ('_filename',)
 
-    def __init__(self, value: str) -> None:
-        """Initialize a key with a str value."""
+    @staticmethod
+    def _normalize(value: str) -> str:
+        """Coerce ``value`` to an ``arxiv://`` URI."""
         if not value.startswith('arxiv:///'):
             value = f'arxiv:///{value.lstrip("/")}'
-        super(Key, self).__init__(value)
-        _, self.filename = os.path.split(self.path)
+        return value
+
+    _filename: str
+
+    @property
+    def filename(self) -> str:
+        """Name of the file at the end of the key."""
+        filename: Optional[str] = getattr(self, '_filename', None)
+        if filename is None:
+            filename = self._filename = self.path.rpartition('/')[2]
+        return filename
 
 
 class CanonicalFile(CanonicalBase):
     """Represents a file in the canonical record, e.g. a source package."""
 
+    __slots__ = ('modified', 'size_bytes', 'content_type', 'filename', 'ref',
+                 'is_gzipped', '_dict_cache', '_mime_type')
+
     modified: datetime
     """Last time the file was modified."""
 
@@ -105,37 +225,78 @@ class CanonicalFile(CanonicalBase):
                  ref: URI,
                  filename: Optional[str] = None,
                  is_gzipped: bool = False) -> None:
-        self.modified = modified
-        self.size_bytes = size_bytes
-        self.content_type = content_type
-        self.filename = filename
-        self.ref = ref
-        self.is_gzipped = is_gzipped
+        self._dict_cache: Optional[Dict[str, Any]]
+        self._mime_type: str
+        # Nothing is cached yet, so we can go around __setattr__.
+        init = super(CanonicalFile, self).__setattr__
+        init('modified', modified)
+        init('size_bytes', size_bytes)
+        init('content_type', content_type)
+        init('filename', filename)
+        init('ref', ref)
+        init('is_gzipped', is_gzipped)
+        init('_dict_cache', None)
+        init('_mime_type', content_type.mime_type)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, dropping the cached dict if a field changes."""
+        super(CanonicalFile, self).__setattr__(name, value)
+        if not name.startswith('_'):
+            super(CanonicalFile, self).__setattr__('_dict_cache', None)
+        if name == 'content_type':
+            super(CanonicalFile, self).__setattr__('_mime_type',
+                                                   value.mime_type)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'CanonicalFile':
         """Reconstitute a :class:`.CanonicalFile` from a native dict."""
         return cls(
-            modified=datetime.fromisoformat(data['modified']),  # type: ignore ; pylint: disable=no-member
+            modified=_parse_datetime(data['modified']),
             size_bytes=data['size_bytes'],
-            content_type=ContentType(data['content_type']),
+            content_type=_content_type(data['content_type']),
             filename=data['filename'],
             ref=URI(data['ref']),
             is_gzipped=data.get('is_gzipped', False)
         )
 
+    @classmethod
+    def from_dict_many(cls, data: Iterable[Dict[str, Any]]) \
+            -> List['CanonicalFile']:
+        """
+        Reconstitute several :class:`.CanonicalFile`s from native dicts.
+
+        Equivalent to calling :meth:`.from_dict` on each item, but avoids
+        re-resolving the same names for every file.
+        """
+        parse_datetime, content_type, make_uri = \
+            _parse_datetime, _content_type, URI
+        files: List[CanonicalFile] = []
+        append = files.append
+        for item in data:
+            append(cls(
+                modified=parse_datetime(item['modified']),
+                size_bytes=item['size_bytes'],
+                content_type=content_type(item['content_type']),
+                filename=item['filename'],
+                ref=make_uri(item['ref']),
+                is_gzipped=item.get('is_gzipped', False)
+            ))
+        return files
+
     @property
     def mime_type(self) -> str:
         """Convenience accessor for the MIME type of the file."""
-        return self.content_type.mime_type
+        return self._mime_type
 
     def to_dict(self) -> Dict[str, Any]:
         """Generate a native dict from this :class:`.CanonicalFile`."""
-        return {
-            'modified': self.modified.isoformat(),
-            'size_bytes': self.size_bytes,
-            'content_type': self.content_type.value,
-            'filename': self.filename,
-            'ref': self.ref,
-            'is_gzipped': self.is_gzipped
-        }
+        if self._dict_cache is None:
+            self._dict_cache = {
+                'modified': self.modified.isoformat(),
+                'size_bytes': self.size_bytes,
+                'content_type': self.content_type.value,
+                'filename': self.filename,
+                'ref': self.ref,
+                'is_gzipped': self.is_gzipped
+            }
+        return dict(self._dict_cache)
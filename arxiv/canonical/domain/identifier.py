@@ -55,8 +55,7 @@ class Identifier(str):
     @classmethod
     def from_parts(cls, year: int, month: int, inc: int) -> 'Identifier':
         """Generate a new-style identifier from its parts."""
-        prefix = f'{str(year)[-2:]}{str(month).zfill(2)}'
-        return cls(f'{prefix}.{str(inc).zfill(5)}')
+        return cls(f'{str(year)[-2:]}{month:02d}.{inc:05d}')
 
     @property
     def category_part(self) -> str:
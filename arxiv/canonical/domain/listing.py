@@ -1,7 +1,8 @@
 """Provides domain concepts and logic for event listings."""
 
 import datetime
-from collections import defaultdict
+from collections import Counter
+from operator import attrgetter
 from typing import NamedTuple, MutableSequence, Mapping, Tuple, Optional, \
     Any, Dict, Iterable, Callable
 
@@ -13,6 +14,8 @@ Year = int
 Month = int
 YearMonth = Tuple[Year, Month]
 
+_event_type = attrgetter('event_type')
+
 
 class ListingIdentifier(str):
     """
@@ -32,7 +35,7 @@ class ListingIdentifier(str):
         if ':' in name:
             raise ValueError('Name may not contains colons `:`')
         """Generate a listing identifier from its parts."""
-        return cls(date.strftime(f'%Y-%m-%d::{name}'))
+        return cls(f'{date.year}-{date.month:02d}-{date.day:02d}::{name}')
 
 
 class Listing(CanonicalBase):
@@ -77,10 +80,8 @@ class Listing(CanonicalBase):
     @property
     def number_of_events_by_type(self) -> Dict[EventType, int]:
         """Number of events in this listing by event type."""
-        counts: Dict[EventType, int] = defaultdict(int)
-        for event in self.events:
-            counts[event.event_type] += 1
-        return dict(counts.items())
+        # Counter tallies in C, rather than in a Python loop over the events.
+        return dict(Counter(map(_event_type, self.events)))
 
     @property
     def number_of_versions(self) -> int:
@@ -71,6 +71,35 @@ class TestHTTPURI(TestCase):
         self.assertEqual(uri.scheme, 'ftp')
 
 
+class TestURIInstances(TestCase):
+    """Equivalent URIs share a single instance."""
+
+    def test_same_uri(self):
+        """The same URI constructed twice is the same object."""
+        self.assertIs(URI('/path/to/data'), URI('file:///path/to/data'))
+
+    def test_key_and_uri(self):
+        """A key is not shared with an URI having the same value."""
+        uri = URI('arxiv:///path/to/a/resource')
+        key = Key('/path/to/a/resource')
+        self.assertEqual(uri, key)
+        self.assertIsNot(uri, key)
+        self.assertIsInstance(key, Key)
+        self.assertNotIsInstance(uri, Key)
+
+    def test_invalid_uri(self):
+        """An invalid URI is not shared, even while it is still referenced."""
+        errors = []
+        for _ in range(2):
+            try:
+                URI('path/to/some/data')
+            except ValueError as e:
+                errors.append(e)    # Keeps the traceback, and the URI, alive.
+            else:
+                self.fail('Expected a ValueError')
+        self.assertNotIn((URI, 'path/to/some/data'), URI._instances)
+
+
 class TestKey(TestCase):
     """Key is a canonical URI."""
 
@@ -83,6 +112,13 @@ class TestKey(TestCase):
         self.assertEqual(key.scheme, 'arxiv')
         self.assertEqual(str(key), f'arxiv://{raw}')
 
+    def test_filename(self):
+        """The filename is the last part of the path, regardless of OS."""
+        self.assertEqual(Key('/path/to/a/resource.json').filename,
+                         'resource.json')
+        self.assertEqual(Key('/path/to/a\\resource').filename,
+                         'a\\resource')
+
 
 class TestCanonicalFile(TestCase):
     def setUp(self):
@@ -107,3 +143,40 @@ class TestCanonicalFile(TestCase):
         self.assertEqual(self.canonical_file.mime_type,
                          ContentType.json.mime_type)
 
+    def test_mime_type_when_content_type_changes(self):
+        """MIME type follows changes to the content type."""
+        self.canonical_file.content_type = ContentType.pdf
+        self.assertEqual(self.canonical_file.mime_type,
+                         ContentType.pdf.mime_type)
+
+    def test_dict_reflects_changes(self):
+        """Changes to the file are reflected in subsequent dicts."""
+        before = self.canonical_file.to_dict()
+        self.canonical_file.size_bytes = 42
+        self.canonical_file.is_gzipped = True
+        after = self.canonical_file.to_dict()
+        self.assertEqual(before['size_bytes'], 5_324)
+        self.assertEqual(after['size_bytes'], 42)
+        self.assertTrue(after['is_gzipped'])
+
+    def test_dict_is_a_copy(self):
+        """Modifying a generated dict does not affect the file."""
+        self.canonical_file.to_dict()['filename'] = 'bar.json'
+        self.assertEqual(self.canonical_file.to_dict()['filename'],
+                         'foo.json')
+
+    def test_from_dict_many(self):
+        """Several CanonicalFiles can be reconstituted at once."""
+        other = CanonicalFile(
+            modified=datetime.now(),
+            size_bytes=1_024,
+            content_type=ContentType.pdf,
+            filename='foo.pdf',
+            ref=URI('arxiv:///key/for/foo.pdf'),
+            is_gzipped=True
+        )
+        files = CanonicalFile.from_dict_many(
+            [self.canonical_file.to_dict(), other.to_dict()]
+        )
+        self.assertEqual(files, [self.canonical_file, other])
+        self.assertTrue(files[1].is_gzipped)
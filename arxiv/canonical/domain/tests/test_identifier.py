@@ -16,4 +16,14 @@ class TestIdentifierComparisons(TestCase):
         self.assertGreater(Identifier('cond-mat/9805021'),
                            Identifier('hep-ex/9802024'))
         self.assertGreaterEqual(Identifier('cond-mat/9805021'),
-                                Identifier('hep-ex/9802024'))
\ No newline at end of file
+                                Identifier('hep-ex/9802024'))
+
+
+class TestIdentifierFromParts(TestCase):
+    """New-style identifiers can be built from their parts."""
+
+    def test_from_parts(self):
+        """The month and incremental part are zero-padded."""
+        self.assertEqual(Identifier.from_parts(2029, 1, 345), '2901.00345')
+        self.assertEqual(Identifier.from_parts(2029, 12, 12345),
+                         '2912.12345')
@@ -0,0 +1,30 @@
+"""Tests for :mod:`arxiv.canonical.domain.listing`."""
+
+from datetime import date
+from unittest import TestCase, mock
+
+from ..listing import Listing, ListingIdentifier
+from ..version import EventType
+
+
+class TestListing(TestCase):
+    def test_number_of_events_by_type(self):
+        """Events are counted by type; absent types are left out."""
+        events = [mock.MagicMock(event_type=event_type)
+                  for event_type in (EventType.NEW, EventType.REPLACED,
+                                     EventType.NEW)]
+        listing = Listing(ListingIdentifier.from_parts(date(2029, 1, 29),
+                                                       'foo'),
+                          events=events)
+        self.assertEqual(listing.number_of_events_by_type,
+                         {EventType.NEW: 2, EventType.REPLACED: 1})
+        self.assertIs(type(listing.number_of_events_by_type), dict)
+
+
+class TestListingIdentifier(TestCase):
+    def test_from_parts(self):
+        """The name is taken literally, after the date."""
+        identifier = ListingIdentifier.from_parts(date(2029, 1, 2), 'foo%d')
+        self.assertEqual(identifier, '2029-01-02::foo%d')
+        self.assertEqual(identifier.date, date(2029, 1, 2))
+        self.assertEqual(identifier.name, 'foo%d')
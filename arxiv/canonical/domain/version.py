@@ -261,6 +261,10 @@ class Version(CanonicalBase):
         render: Optional[CanonicalFile] = None
         if 'render' in data and data['render']:
             render = CanonicalFile.from_dict(data['render'])
+        formats = data.get('formats', [])
+        format_files = CanonicalFile.from_dict_many(
+            entry['content'] for entry in formats
+        )
         return cls(
             identifier=VersionedIdentifier(data['identifier']),
             announced_date=datetime.fromisoformat(data['announced_date']).date(),  # type: ignore ; pylint: disable=no-member
@@ -280,9 +284,8 @@ class Version(CanonicalBase):
             source=CanonicalFile.from_dict(data['source']),
             source_type=source_type,
             formats={
-                ContentType(entry["format"]):
-                    CanonicalFile.from_dict(entry["content"])
-                for entry in data.get('formats', [])
+                ContentType(entry['format']): cf
+                for entry, cf in zip(formats, format_files)
             }
         )
 
@@ -53,6 +53,10 @@ transmitted as URL-safe base64-encoded strings.
 The same hierarchy is used for listing files, where the terminal bitstream
 is the binary serialized manifest.
 
+Since each level only depends on the checksums of the level below it, a
+single file can be verified against a trusted checksum from higher up using
+just the manifests along the way; see :func:`.checksum.verify_path`.
+
 A global integrity collection, :class:`.Integrity` draws together the
 e-print and listing hierarchies into a final, composite level.
 """
@@ -61,7 +65,7 @@ from typing import Union
 
 from ..util import GenericMonoDict
 
-from .checksum import calculate_checksum
+from .checksum import calculate_checksum, verify_path
 from .core import (IntegrityBase, IntegrityEntry, IntegrityEntryBase,
                    IntegrityEntryMembers, R)
 from .listing import (IntegrityListing, IntegrityListingDay,
@@ -89,6 +93,7 @@ __all__ = (
     'IntegrityMonth',
     'IntegrityVersion',
     'IntegrityYear',
+    'verify_path',
 )
 
 
@@ -114,3 +119,5 @@ class Integrity(IntegrityBase[None,
                               str,
                               Union[IntegrityEPrints, IntegrityListings]]):
     """Apex of the integrity collection."""
+
+    __slots__ = ()
@@ -1,51 +1,344 @@
-import io
+import mmap
+import os
 from base64 import urlsafe_b64encode
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from hashlib import md5
+from hmac import compare_digest
+from io import BytesIO, FileIO
 from operator import itemgetter
-from typing import List, IO, Union, cast
+from threading import Lock
+from typing import Any, Callable, Dict, List, IO, Optional, Sequence, Tuple, \
+    Union, cast
 
 from ..record import RecordStream
-from ..manifest import Manifest
+from ..manifest import Manifest, checksum_from_manifest
 from .exceptions import ChecksumError
 
+DIGEST_SIZE = 16
+"""Size (in bytes) of the digests that make up our checksums."""
 
-def calculate_checksum(obj: Union[bytes, IO[bytes], Manifest, RecordStream]) \
-        -> str:
+GIL_MINSIZE = 2048
+"""hashlib only releases the GIL for data larger than this (in bytes)."""
+
+HASH_WORKERS = min(8, os.cpu_count() or 1)
+"""Maximum number of threads used to calculate checksums concurrently."""
+
+CHECKSUM_CACHE_SIZE = 100_000
+"""Maximum number of file checksums that are remembered."""
+
+CHUNK_SIZE = 1 << 20
+"""Number of bytes read at a time from streams that can't be hashed whole."""
+
+_hash_pool: Optional[ThreadPoolExecutor] = None
+_hash_pool_lock = Lock()
+
+_FileIdentity = Tuple[int, int, int, int]
+_digest_cache: 'OrderedDict[_FileIdentity, bytes]' = OrderedDict()
+_digest_cache_lock = Lock()
+
+Checksummable = Union[bytes, IO[bytes], Manifest, RecordStream]
+
+
+# Digests are padded out to a whole number of base64 groups (three bytes), so
+# that several of them can be encoded together; see :func:`_encode_many`.
+_PADDED_SIZE = -(-DIGEST_SIZE // 3) * 3
+_PADDING = bytes(_PADDED_SIZE - DIGEST_SIZE)
+_ENCODED_WIDTH = _PADDED_SIZE // 3 * 4
+_ENCODED_SIZE = -(-DIGEST_SIZE * 4 // 3)
+_ENCODED_PADDING = '=' * (_ENCODED_WIDTH - _ENCODED_SIZE)
+
+
+def calculate_checksum(obj: Checksummable, use_cache: bool = True) -> str:
+    """
+    Calculate the checksum of ``obj``.
+
+    The digests of files on disk are remembered (see :func:`_digest_file`),
+    but a file that is modified in place may keep its size and modification
+    time. Pass ``use_cache=False`` when verifying content, so that it is
+    always read again.
+    """
+    return _encode(_calculate_digest(obj, use_cache))
+
+
+def _calculate_digest(obj: Checksummable, use_cache: bool = True) -> bytes:
+    # Most objects are exactly one of a handful of types, which can be looked
+    # up directly; subclasses and other file-like objects fall through to the
+    # checks below, as does everything that must not come from the cache.
+    handler = _DIGEST_HANDLERS.get(type(obj)) if use_cache else None
+    if handler is not None:
+        return handler(obj)
+    # IO objects are duck-typed rather than checked against the io.IOBase ABC,
+    # which is comparatively expensive (and excludes some file-like objects).
+    if isinstance(obj, RecordStream):
+        return _digest_stream(obj, use_cache)
     if isinstance(obj, bytes):
-        return checksum_raw(obj)
+        return _digest_bytes(obj)
     if isinstance(obj, dict):
-        return checksum_manifest(obj)
-    if isinstance(obj, io.IOBase):
-        return checksum_io(obj)
-    if isinstance(obj, RecordStream):
-        assert obj.content is not None
-        return checksum_io(obj.content)
+        return _digest_manifest(obj)
+    if hasattr(obj, 'read'):
+        return _digest_io(obj, use_cache)
     raise TypeError(f'Cannot generate a checksum from a {type(obj)}')
 
 
+def _digest_stream(stream: RecordStream, use_cache: bool = True) -> bytes:
+    assert stream.content is not None
+    return _digest_io(stream.content, use_cache)
+
+
+def _digest_bytes(raw: bytes) -> bytes:
+    return md5(raw).digest()
+
+
+def calculate_checksums(objs: Sequence[Checksummable]) -> List[str]:
+    """
+    Calculate checksums for several objects at once.
+
+    hashlib releases the GIL while it hashes (and so does reading from files),
+    so independent streams are hashed concurrently on a shared thread pool.
+    Objects that share an underlying stream are hashed only once, so that the
+    stream is never read from two threads at the same time. Small in-memory
+    objects are hashed in the calling thread, since hashlib holds on to the
+    GIL for them anyway.
+
+    Returns the checksums in the same order as ``objs``.
+    """
+    if len(objs) < 2:
+        return [calculate_checksum(obj) for obj in objs]
+    keys = [_identity(obj) for obj in objs]
+    unique: Dict[int, Checksummable] = {}
+    for key, obj in zip(keys, objs):
+        unique.setdefault(key, obj)
+    pooled = [(key, obj) for key, obj in unique.items() if not _is_small(obj)]
+    digests: Dict[int, bytes] = {}
+    if len(pooled) > 1:
+        digests.update(zip((key for key, _ in pooled), _get_hash_pool().map(
+            _calculate_digest, (obj for _, obj in pooled)
+        )))
+    for key, obj in unique.items():
+        if key not in digests:
+            digests[key] = _calculate_digest(obj)
+    checksums = dict(zip(digests, _encode_many(list(digests.values()))))
+    return [checksums[key] for key in keys]
+
+
+def _is_small(obj: Checksummable) -> bool:
+    """Whether ``obj`` is held in memory, and too small to release the GIL."""
+    content = obj.content if isinstance(obj, RecordStream) else obj
+    if isinstance(content, bytes):
+        return len(content) < GIL_MINSIZE
+    if isinstance(content, BytesIO) and type(content) is BytesIO:
+        return len(content.getvalue()) < GIL_MINSIZE
+    return isinstance(content, dict)
+
+
+def _encode(digest: bytes) -> str:
+    return urlsafe_b64encode(digest).decode('utf-8')
+
+
+def _encode_many(digests: Sequence[bytes]) -> List[str]:
+    """
+    URL-safe base64-encode several digests with a single call.
+
+    Each digest is padded with zero bytes to a whole number of base64 groups,
+    so that it encodes to its own slice of the output. The encoded zero bytes
+    are then swapped for the ``=`` padding that encoding the digest on its own
+    would have produced.
+    """
+    if any(len(digest) != DIGEST_SIZE for digest in digests):
+        raise ValueError(f'Digests must be {DIGEST_SIZE} bytes long')
+    encoded = urlsafe_b64encode(
+        _PADDING.join(digests) + _PADDING
+    ).decode('utf-8')
+    return [encoded[offset:offset + _ENCODED_SIZE] + _ENCODED_PADDING
+            for offset in range(0, len(encoded), _ENCODED_WIDTH)]
+
+
+def _identity(obj: Checksummable) -> int:
+    if isinstance(obj, RecordStream):
+        return id(obj.content)
+    return id(obj)
+
+
+def _get_hash_pool() -> ThreadPoolExecutor:
+    global _hash_pool
+    if _hash_pool is None:
+        with _hash_pool_lock:
+            if _hash_pool is None:
+                _hash_pool = ThreadPoolExecutor(max_workers=HASH_WORKERS)
+    return _hash_pool
+
+
 def checksum_raw(raw: bytes) -> str:
-    hash_md5 = md5()
-    hash_md5.update(raw)
-    return urlsafe_b64encode(hash_md5.digest()).decode('utf-8')
+    return _encode(md5(raw).digest())
 
 
 def checksum_io(content: IO[bytes]) -> str:
     """Generate an URL-safe base64-encoded md5 hash of an IO."""
-    if content.seekable:
+    return _encode(_digest_io(content))
+
+
+def _digest_io(content: IO[bytes], use_cache: bool = True) -> bytes:
+    if isinstance(content, BytesIO) and type(content) is BytesIO:
+        # Most small entries (metadata, listings) are held in memory; we can
+        # hash their content in one go rather than copying it out in chunks.
+        # getvalue() hands back the bytes that the BytesIO was made from, if
+        # it hasn't been written to, whereas getbuffer() would copy them.
+        # Subclasses (e.g. proxies for remote content) may not keep their
+        # content in the buffer, so they are read like any stream.
+        content.seek(0)     # Be a good neighbor for subsequent users.
+        return md5(content.getvalue()).digest()
+    fileno = _get_fileno(content)
+    if fileno is not None:
+        digest = _digest_file(fileno, use_cache)
+        if digest is not None:
+            content.seek(0)
+            return digest
+    seekable = content.seekable()
+    if seekable:
         content.seek(0)     # Make sure that we are at the start of the stream.
     hash_md5 = md5()
-    for chunk in iter(lambda: content.read(4096), b""):
-
+    # Streams that get here are usually wrappers (gzip, proxies) that only
+    # implement read(), so we read rather than readinto() a buffer.
+    read = content.read
+    for chunk in iter(lambda: read(CHUNK_SIZE), b""):
         hash_md5.update(chunk)
-    if content.seekable:
+    if seekable:
         content.seek(0)     # Be a good neighbor for subsequent users.
-    return urlsafe_b64encode(hash_md5.digest()).decode('utf-8')
+    return hash_md5.digest()
+
+
+def _get_fileno(content: IO[bytes]) -> Optional[int]:
+    """
+    Get the descriptor of the plain file behind ``content``, if there is one.
+
+    Only plain (optionally buffered) files qualify; wrappers like
+    :class:`gzip.GzipFile` have a descriptor too, but its content is not what
+    the wrapper reads.
+    """
+    raw = getattr(content, 'raw', content)
+    if isinstance(raw, FileIO) and not raw.closed:
+        return raw.fileno()
+    return None
+
+
+def _digest_file(fileno: int, use_cache: bool = True) -> Optional[bytes]:
+    """
+    Hash a file, reusing the digest from an earlier call if possible.
+
+    The same files tend to be hashed several times over while a record is
+    built. A file is identified by its device, inode, size and modification
+    time, so the digest is recalculated if the file is replaced or modified
+    in the usual way. Content that is corrupted in place can keep all four,
+    so a remembered digest is not reused if ``use_cache`` is ``False``; the
+    digest that is calculated is still remembered.
+    """
+    stat = os.fstat(fileno)
+    key = (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+    if use_cache:
+        with _digest_cache_lock:
+            digest = _digest_cache.get(key)
+            if digest is not None:
+                _digest_cache.move_to_end(key)
+                return digest
+    digest = _digest_mapped(fileno)
+    if digest is not None:
+        with _digest_cache_lock:
+            _digest_cache[key] = digest
+            if len(_digest_cache) > CHECKSUM_CACHE_SIZE:
+                _digest_cache.popitem(last=False)
+    return digest
+
+
+def clear_checksum_cache() -> None:
+    """Forget the checksums of files that have already been hashed."""
+    with _digest_cache_lock:
+        _digest_cache.clear()
+
+
+def _digest_mapped(fileno: int) -> Optional[bytes]:
+    """
+    Hash a file by mapping it into memory, rather than reading it.
+
+    The whole mapping is handed to the hash in one call, so nothing is copied
+    into Python objects and the GIL is released for the duration. Returns
+    ``None`` if the file can't be mapped (e.g. if it is empty, or is not a
+    regular file).
+    """
+    try:
+        with mmap.mmap(fileno, 0, access=mmap.ACCESS_READ) as mapped:
+            return md5(mapped).digest()     # type: ignore
+    except (ValueError, OSError):
+        return None
 
 
 def checksum_manifest(manifest: Manifest) -> str:
-    components: List[str] = []
+    return _encode(_digest_manifest(manifest))
+
+
+def _digest_manifest(manifest: Manifest) -> bytes:
+    # The checksums are fed to the hash one at a time, rather than joined up
+    # first; they are base64, so ASCII is all that is needed to encode them.
+    hash_md5 = md5()
+    update = hash_md5.update
     for entry in sorted(manifest['entries'], key=itemgetter('key')):
-        if 'checksum' not in entry or entry['checksum'] is None:
+        checksum = entry.get('checksum')
+        if checksum is None:
             raise ChecksumError(f'Missing checksum: {entry}')
-        components.append(entry['checksum'])
-    return checksum_raw(''.join(components).encode('utf-8'))
\ No newline at end of file
+        update(checksum.encode('ascii'))
+    return hash_md5.digest()
+
+
+def verify_path(checksum: str, manifests: Sequence[Manifest],
+                path: Sequence[str], leaf_checksum: str) -> bool:
+    """
+    Verify a single member of the record against a trusted checksum.
+
+    Rather than building (and hashing) the whole integrity hierarchy, only
+    the manifests along the way from the top of the hierarchy down to the
+    member are checked. Each manifest must hash to the checksum that its
+    parent holds for it, starting from ``checksum``.
+
+    Parameters
+    ----------
+    checksum : str
+        The trusted checksum of the first manifest in ``manifests``.
+    manifests : sequence
+        The manifests on the way down to the member, starting from the top.
+    path : sequence
+        The key of the next step down in each of the ``manifests``, ending
+        with the key of the member itself.
+    leaf_checksum : str
+        The checksum of the member, e.g. from :func:`calculate_checksum`
+        with ``use_cache=False``, so that the member is actually read.
+
+    Returns
+    -------
+    bool
+        ``True`` if every manifest on the path, and the member itself, have
+        the expected checksums.
+
+    """
+    if len(manifests) != len(path):
+        raise ValueError('Expected one key for each manifest')
+    expected = checksum
+    for manifest, key in zip(manifests, path):
+        if not compare_digest(checksum_manifest(manifest), expected):
+            return False
+        try:
+            child_checksum = checksum_from_manifest(manifest, key)
+        except KeyError:
+            return False
+        if child_checksum is None:
+            return False
+        expected = child_checksum
+    return compare_digest(leaf_checksum, expected)
+
+
+_DIGEST_HANDLERS: Dict[type, Callable[[Any], bytes]] = {
+    RecordStream: _digest_stream,
+    bytes: _digest_bytes,
+    dict: _digest_manifest,
+    BytesIO: _digest_io
+}
+"""Digest functions for the types that we checksum most often, by type."""
@@ -1,9 +1,11 @@
 """Base classes and concepts for the integrity system."""
 
 from datetime import date
+from hmac import compare_digest
 from operator import attrgetter, itemgetter
 from typing import IO, NamedTuple, List, Dict, Sequence, Optional, Tuple, \
     Mapping, Generic, TypeVar, Union, Iterable, Type
+from weakref import ReferenceType, ref
 
 from mypy_extensions import TypedDict
 from typing_extensions import Literal
@@ -26,6 +28,10 @@ Year = int
 Month = int
 YearMonth = Tuple[int, int]
 
+_EVENT_TYPES: Tuple[EventType, ...] = tuple(EventType)
+_ZERO_BY_TYPE: Dict[EventType, int] = dict.fromkeys(_EVENT_TYPES, 0)
+"""Template for event counts by type; copy it before use."""
+
 
 # These TypeVars are used as placeholders in the generic IntegrityBase class,
 # below. To learn more about TypeVars and Generics, see
@@ -59,6 +65,10 @@ class IntegrityBase(Generic[_Name, _Record, _MemberName, _Member]):
     to subclass.
     """
 
+    __slots__ = ('_manifest', '_checksum', '_members', '_record',
+                 '_manifest_name', '_manifest_index', '_checksum_is_stale',
+                 '_checksum_from_caller', 'name')
+
     member_type: Type[_Member]
     """The type of members contained by an instance of a register class."""
 
@@ -71,15 +81,21 @@ class IntegrityBase(Generic[_Name, _Record, _MemberName, _Member]):
         self._checksum = checksum
         self._members = members
         self._record = record
+        self._manifest_name: Optional[str] = None
+        self._manifest_index: Optional[Dict[str, int]] = None
+        self._checksum_is_stale = False
+        # A checksum that was passed in (e.g. from a parent manifest) has not
+        # been checked against our own manifest.
+        self._checksum_from_caller = checksum is not None
         self.name = name
 
     @classmethod
     def from_record(cls: Type[_Self], record: _Record,
                     checksum: Optional[str] = None,
                     calculate_new_checksum: bool = True) -> _Self:
+        member_from_record = cls.member_type.from_record
         members = {
-            key: cls.member_type.from_record(member_record,
-                                             calculate_new_checksum=True)
+            key: member_from_record(member_record, calculate_new_checksum=True)
             for key, member_record in record.members.items()
         }
         manifest = cls.make_manifest(members)
@@ -91,30 +107,52 @@ class IntegrityBase(Generic[_Name, _Record, _MemberName, _Member]):
     @classmethod
     def make_manifest(cls, members: Mapping[_MemberName, _Member]) -> Manifest:
         """Make a :class:`.Manifest` for this integrity collection."""
-        entries = [cls.make_manifest_entry(members[n]) for n in members]
-        number_of_events_by_type = {
-            etype: sum([e['number_of_events_by_type'].get(etype, 0)
-                        for e in entries])
-            for etype in EventType
+        make_entry = cls.make_manifest_entry
+        entries: List[ManifestEntry] = []
+        number_of_events = number_of_versions = 0
+        number_of_events_by_type = _ZERO_BY_TYPE.copy()
+        for member in members.values():
+            entry = make_entry(member)
+            entries.append(entry)
+            number_of_events += entry['number_of_events']
+            number_of_versions += entry['number_of_versions']
+            for etype, count in entry['number_of_events_by_type'].items():
+                if etype in number_of_events_by_type:
+                    number_of_events_by_type[etype] += count
+        # Checksums are calculated over the entries in key order. If they are
+        # already in that order, sorting them again takes a single pass.
+        entries.sort(key=itemgetter('key'))
+        return {
+            'entries': entries,
+            'number_of_events': number_of_events,
+            'number_of_events_by_type': number_of_events_by_type,
+            'number_of_versions': number_of_versions,
         }
-        return Manifest(
-            entries=entries,
-            number_of_events=sum([e['number_of_events'] for e in entries]),
-            number_of_events_by_type=number_of_events_by_type,
-            number_of_versions=sum([e['number_of_versions'] for e in entries]),
-        )
 
     @classmethod
     def make_manifest_entry(cls, member: _Member) -> ManifestEntry:
-        return ManifestEntry(key=member.manifest_name,
-                             checksum=member.checksum,
-                             number_of_events=member.manifest['number_of_events'],
-                             number_of_events_by_type=member.manifest['number_of_events_by_type'],
-                             number_of_versions=member.manifest['number_of_versions'])
+        # Manifests and their entries are built with dict literals; calling
+        # the TypedDict goes through a Python-level constructor, which adds
+        # up over a whole collection.
+        manifest = member.manifest
+        return {
+            'key': member.manifest_name,
+            'checksum': member.checksum,
+            'number_of_events': manifest['number_of_events'],
+            'number_of_events_by_type': manifest['number_of_events_by_type'],
+            'number_of_versions': manifest['number_of_versions']
+        }
 
     @property
     def checksum(self) -> str:
-        """The checksum of this integrity collection."""
+        """
+        The checksum of this integrity collection.
+
+        If the manifest has been extended since the checksum was last
+        calculated, it is recalculated here.
+        """
+        if self._checksum_is_stale:
+            self.update_checksum()
         if self._checksum is None:
             raise RuntimeError(f'Missing checksum for {self}')
         assert self._checksum is not None
@@ -123,7 +161,13 @@ class IntegrityBase(Generic[_Name, _Record, _MemberName, _Member]):
     @property
     def is_valid(self) -> bool:
         """Indicates whether or not this collection has a valid checksum."""
-        return bool(self.checksum == self.calculate_checksum())
+        if self._checksum_is_stale:
+            # The checksum is about to be calculated from the manifest anyway,
+            # so there is nothing to compare it to.
+            self.update_checksum()
+            return True
+        return compare_digest(self.checksum,
+                              self.calculate_checksum(use_cache=False))
 
     @property
     def manifest(self) -> Manifest:
@@ -134,7 +178,9 @@ class IntegrityBase(Generic[_Name, _Record, _MemberName, _Member]):
     @property
     def manifest_name(self) -> str:
         """Get the name of this object for a parent manifest."""
-        return str(self.name)
+        if self._manifest_name is None:
+            self._manifest_name = self.make_manifest_name()
+        return self._manifest_name
 
     @property
     def members(self) -> Mapping[_MemberName, _Member]:
@@ -158,25 +204,55 @@ class IntegrityBase(Generic[_Name, _Record, _MemberName, _Member]):
         assert self._record is not None
         return self._record
 
-    def calculate_checksum(self) -> str:
-        return calculate_checksum(self.manifest)
+    def calculate_checksum(self, use_cache: bool = True) -> str:
+        return calculate_checksum(self.manifest, use_cache=use_cache)
 
     def extend_manifest(self, member: _Member) -> None:
         entry = self.make_manifest_entry(member)
+        if self._manifest_index is not None:
+            self._manifest_index.setdefault(entry['key'],
+                                            len(self.manifest['entries']))
         self.manifest['entries'].append(entry)
         self.manifest['number_of_versions'] += entry['number_of_versions']
         self.manifest['number_of_events'] += entry['number_of_events']
-        for key in self.manifest['number_of_events_by_type']:
-             self.manifest['number_of_events_by_type'][key] += entry['number_of_events_by_type'][key]
-        # print(self, type(self), self.manifest)
-        self.update_checksum()
+        by_type = self.manifest['number_of_events_by_type']
+        for etype, count in entry['number_of_events_by_type'].items():
+            by_type[etype] = by_type.get(etype, 0) + count
+        # Members tend to be added many at a time, so rather than re-hashing
+        # the whole manifest for each one we wait until the checksum is
+        # needed.
+        self._checksum_is_stale = True
+
+    def make_manifest_name(self) -> str:
+        """
+        Make the name of this object for a parent manifest.
+
+        This is called once per instance; the result is held by
+        :attr:`.manifest_name`.
+        """
+        return str(self.name)
 
     def iter_members(self) -> Iterable[_Member]:
-        return [self.members[name] for name in self.members]
+        return self.members.values()
+
+    def refresh_checksum(self) -> None:
+        """
+        Set the checksum for this record, if it may be out of date.
+
+        Unlike :meth:`.update_checksum`, the manifest is only re-hashed if it
+        has changed since the checksum was calculated, or if there is no
+        checksum. A checksum that was passed to the constructor may not match
+        the manifest, so the first refresh always re-hashes it.
+        """
+        if self._checksum_is_stale or self._checksum_from_caller \
+                or self._checksum is None:
+            self.update_checksum()
 
     def update_checksum(self) -> None:
         """Set the checksum for this record."""
         self._checksum = self.calculate_checksum()
+        self._checksum_is_stale = False
+        self._checksum_from_caller = False
 
     def set_record(self, record: _Record) -> None:
         self._record = record
@@ -184,24 +260,83 @@ class IntegrityBase(Generic[_Name, _Record, _MemberName, _Member]):
     def update_or_extend_manifest(self, member: _Member, checksum: str) \
             -> None:
         """Update the checksum on a manifest entry, or add a new entry."""
-        found = False
-        for entry in self.manifest['entries']:
-            # Update existing manifest entry.
-            if entry['key'] == member.manifest_name:
-                entry['checksum'] = checksum
-                found = True
-                break
-        if not found:   # New manifest entry.
+        index = self._get_manifest_index().get(member.manifest_name)
+        if index is None:   # New manifest entry.
             self.extend_manifest(member)
+            return
+        entry = self.manifest['entries'][index]
+        if entry.get('checksum') != checksum:   # Update existing entry.
+            entry['checksum'] = checksum
+            self._checksum_is_stale = True
+
+    def _get_manifest_index(self) -> Dict[str, int]:
+        """
+        Get the position of each entry in the manifest, by key.
+
+        This is built the first time that it is needed, and is kept up to date
+        by :meth:`.extend_manifest`. Where a key is repeated, the first entry
+        wins.
+        """
+        if self._manifest_index is None:
+            self._manifest_index = {}
+            for i, entry in enumerate(self.manifest['entries']):
+                self._manifest_index.setdefault(entry['key'], i)
+        return self._manifest_index
 
 
 class IntegrityEntryBase(IntegrityBase[str, _Record, None, None]):
+    __slots__ = ('_calculated_checksum',)
+
     record_type: Type[_Record]
 
+    def __init__(self, name: str,
+                 record: Optional[_Record] = None,
+                 members: None = None,
+                 manifest: Optional[Manifest] = None,
+                 checksum: Optional[str] = None) -> None:
+        super(IntegrityEntryBase, self).__init__(name, record=record,
+                                                 members=members,
+                                                 manifest=manifest,
+                                                 checksum=checksum)
+        self._calculated_checksum: \
+            Optional[Tuple['ReferenceType[IO[bytes]]', str]] = None
+
+    # This is redefined since entries have no manifest; the record entry is
+    # used instead.
+    def calculate_checksum(self, use_cache: bool = True) -> str:
+        """
+        Calculate the checksum of the content of this entry.
+
+        The result is kept for as long as the record holds on to the same
+        content, so that building manifests doesn't read it each time. The
+        content is only weakly referenced, so that content which the record
+        has let go of can be freed. If the content of the stream is changed
+        in place, call :meth:`.invalidate_checksum`. With ``use_cache=False``
+        (as for :attr:`.is_valid`) the content is always read again.
+        """
+        stream = self.record.stream
+        assert stream.content is not None
+        calculated = self._calculated_checksum
+        if use_cache and calculated is not None \
+                and calculated[0]() is stream.content:
+            return calculated[1]
+        checksum = calculate_checksum(stream, use_cache=use_cache)
+        try:
+            self._calculated_checksum = (ref(stream.content), checksum)
+        except TypeError:   # Not all streams can be weakly referenced.
+            self._calculated_checksum = None
+        return checksum
+
+    def invalidate_checksum(self) -> None:
+        """Forget the checksum calculated by :meth:`.calculate_checksum`."""
+        self._calculated_checksum = None
+
 
 class IntegrityEntry(IntegrityEntryBase[R.RecordEntry]):
     """Integrity concept for a single entry in the record."""
 
+    __slots__ = ()
+
     record_type = R.RecordEntry
 
     @classmethod
@@ -212,8 +347,3 @@ class IntegrityEntry(IntegrityEntryBase[R.RecordEntry]):
         if calculate_new_checksum:
             checksum = calculate_checksum(record.stream)
         return cls(name=record.key, record=record, checksum=checksum)
-
-    # This is redefined since the entry has no manifest; the record entry is
-    # used instead.
-    def calculate_checksum(self) -> str:
-        return calculate_checksum(self.record.stream)
\ No newline at end of file
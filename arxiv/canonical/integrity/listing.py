@@ -6,10 +6,12 @@ from ..manifest import ManifestEntry, Manifest
 
 from .core import (IntegrityBase, IntegrityEntryBase, D, R, _Self,
                    Year, Month, YearMonth, calculate_checksum)
+from .checksum import calculate_checksums
 
 
 
 class IntegrityListing(IntegrityEntryBase[R.RecordListing]):
+    __slots__ = ()
 
     record_type = R.RecordListing
 
@@ -22,11 +24,6 @@ class IntegrityListing(IntegrityEntryBase[R.RecordListing]):
             checksum = calculate_checksum(record.stream)
         return cls(name=record.key, record=record, checksum=checksum)
 
-    # This is redefined since the entry has no manifest; the record entry is
-    # used instead.
-    def calculate_checksum(self) -> str:
-        return calculate_checksum(self.record.stream)
-
 
 
 class IntegrityListingDay(IntegrityBase[date,
@@ -35,19 +32,23 @@ class IntegrityListingDay(IntegrityBase[date,
                                         IntegrityListing]):
     """Integrity collection of listings for a single day."""
 
+    __slots__ = ()
+
     @classmethod
     def make_manifest_entry(cls, member: IntegrityListing) -> ManifestEntry:
         assert isinstance(member.record.domain, D.Listing)
-        return ManifestEntry(key=member.manifest_name,
-                             checksum=member.checksum,
-                             size_bytes=member.record.stream.size_bytes,
-                             mime_type=member.record.stream.content_type.mime_type,
-                             number_of_versions=0,
-                             number_of_events=len(member.record.domain.events),
-                             number_of_events_by_type=member.record.domain.number_of_events_by_type)
-
-    @property
-    def manifest_name(self) -> str:
+        return {
+            'key': member.manifest_name,
+            'checksum': member.checksum,
+            'size_bytes': member.record.stream.size_bytes,
+            'mime_type': member.record.stream.content_type.mime_type,
+            'number_of_versions': 0,
+            'number_of_events': len(member.record.domain.events),
+            'number_of_events_by_type':
+                member.record.domain.number_of_events_by_type
+        }
+
+    def make_manifest_name(self) -> str:
         """The name to use for this record in a parent manifest."""
         return self.name.isoformat()
 
@@ -58,15 +59,19 @@ class IntegrityListingDay(IntegrityBase[date,
         """
         Generate an :class:`.IntegrityListing` from a :class:`.RecordListing`.
         """
-        members = {name: IntegrityListing.from_record(record.members[name])
-                   for name in record.members}
-        # members = {
-        #     record.listing.name: IntegrityEntry.from_record(record.listing)
-        # }
+        # Listing files are independent, so they are hashed together.
+        listings = list(record.members.items())
+        checksums = calculate_checksums([listing.stream
+                                         for _, listing in listings])
+        members = {
+            name: IntegrityListing.from_record(listing,
+                                               checksum=listing_checksum,
+                                               calculate_new_checksum=False)
+            for (name, listing), listing_checksum in zip(listings, checksums)
+        }
         manifest = cls.make_manifest(members)
         if calculate_new_checksum:
             checksum = calculate_checksum(manifest)
-        assert not isinstance(checksum, bool)
         return cls(record.name, members=members, manifest=manifest,
                    checksum=checksum)
 
@@ -77,10 +82,11 @@ class IntegrityListingMonth(IntegrityBase[YearMonth,
                                           IntegrityListingDay]):
     """Integrity collection of listings for a single month."""
 
-    @property
-    def manifest_name(self) -> str:
+    __slots__ = ()
+
+    def make_manifest_name(self) -> str:
         """The name to use for this record in a parent manifest."""
-        return f'{self.year}-{str(self.month).zfill(2)}'
+        return f'{self.year}-{self.month:02d}'
 
     @property
     def month(self) -> Month:
@@ -99,6 +105,8 @@ class IntegrityListingYear(IntegrityBase[Year,
                                          IntegrityListingMonth]):
     """Integrity collection of listings for a single year."""
 
+    __slots__ = ()
+
     @property
     def year(self) -> Year:
         """The numeric year represented by this collection."""
@@ -111,4 +119,4 @@ class IntegrityListings(IntegrityBase[str,
                                       IntegrityListingYear]):
     """Integrity collection of all listings."""
 
-
+    __slots__ = ()
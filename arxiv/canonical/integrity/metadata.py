@@ -6,6 +6,8 @@ from .core import IntegrityEntryBase, R, _Self, calculate_checksum
 class IntegrityMetadata(IntegrityEntryBase[R.RecordMetadata]):
     """Integrity entry for a metadata bitstream in the record."""
 
+    __slots__ = ()
+
     record_type = R.RecordMetadata
 
     @classmethod
@@ -15,8 +17,3 @@ class IntegrityMetadata(IntegrityEntryBase[R.RecordMetadata]):
         if calculate_new_checksum:
             checksum = calculate_checksum(record.stream)
         return cls(name=record.key, record=record, checksum=checksum)
-
-    # This is redefined since the entry has no manifest; the record entry is
-    # used instead.
-    def calculate_checksum(self) -> str:
-        return calculate_checksum(self.record.stream)
\ No newline at end of file
@@ -0,0 +1,207 @@
+"""Tests for :mod:`arxiv.canonical.integrity.checksum`."""
+
+import io
+import os
+import tempfile
+from unittest import TestCase
+
+from ...services.readable import BytesIOProxy
+from ..checksum import CHUNK_SIZE, calculate_checksum, calculate_checksums, \
+    checksum_raw, clear_checksum_cache, verify_path
+from ..exceptions import ChecksumError
+
+
+class TestChecksumIO(TestCase):
+    def test_bytesio_matches_raw(self):
+        """The checksum of an in-memory stream is that of its content."""
+        content = io.BytesIO(b'some content')
+        content.read(4)
+        self.assertEqual(calculate_checksum(content),
+                         checksum_raw(b'some content'))
+        self.assertEqual(content.tell(), 0, 'Stream is rewound')
+
+    def test_bytesio_not_copied(self):
+        """Hashing an in-memory stream doesn't copy its content."""
+        raw = os.urandom(4096)
+        content = io.BytesIO(raw)
+        self.assertEqual(calculate_checksum(content), checksum_raw(raw))
+        self.assertIs(content.getvalue(), raw)
+
+    def test_subclass(self):
+        """Subclasses of the usual stream types are handled too."""
+        class Stream(io.BytesIO):
+            pass
+        self.assertEqual(calculate_checksum(Stream(b'some content')),
+                         checksum_raw(b'some content'))
+
+    def test_proxy(self):
+        """Streams that only override read() are read, not buffer-hashed."""
+        content = BytesIOProxy(lambda: b'some content')
+        self.assertEqual(calculate_checksum(content),
+                         checksum_raw(b'some content'))
+
+    def test_large_stream(self):
+        """Streams larger than a single chunk are read in full."""
+        raw = os.urandom(CHUNK_SIZE * 2 + 17)
+        content = BytesIOProxy(lambda: raw)
+        self.assertEqual(calculate_checksum(content), checksum_raw(raw))
+
+    def test_unseekable(self):
+        """Streams that can't be rewound are read from where they are."""
+        read, write = os.pipe()
+        os.write(write, b'some content')
+        os.close(write)
+        with open(read, 'rb', buffering=0) as pipe:
+            self.assertEqual(calculate_checksum(pipe),
+                             checksum_raw(b'some content'))
+
+    def test_unsupported(self):
+        """Objects that can't be read have no checksum."""
+        with self.assertRaises(TypeError):
+            calculate_checksum(42)
+
+
+class TestCalculateChecksums(TestCase):
+    def test_order(self):
+        """Checksums are returned in the same order as the objects."""
+        contents = [f'content {i}'.encode('utf-8') for i in range(10)]
+        self.assertEqual(
+            calculate_checksums([io.BytesIO(c) for c in contents]),
+            [checksum_raw(c) for c in contents]
+        )
+
+    def test_large_and_small(self):
+        """Large and small objects can be mixed."""
+        contents = [os.urandom(size) for size in (10, 4096, 20, 8192, 30000)]
+        self.assertEqual(
+            calculate_checksums([io.BytesIO(c) for c in contents]),
+            [checksum_raw(c) for c in contents]
+        )
+
+    def test_shared_stream(self):
+        """The same stream may be passed more than once."""
+        content = io.BytesIO(b'shared content')
+        self.assertEqual(calculate_checksums([content, content]),
+                         [checksum_raw(b'shared content')] * 2)
+
+
+class TestChecksumManifest(TestCase):
+    def setUp(self):
+        """We have a manifest with a couple of entries."""
+        self.manifest = {
+            'entries': [{'key': 'b', 'checksum': 'bbbb'},
+                        {'key': 'a', 'checksum': 'aaaa'}],
+            'number_of_events': 0,
+            'number_of_events_by_type': {},
+            'number_of_versions': 0
+        }
+
+    def test_md5(self):
+        """The checksum is the md5 of the entry checksums, sorted by key."""
+        self.assertEqual(calculate_checksum(self.manifest),
+                         checksum_raw(b'aaaabbbb'))
+
+    def test_missing_checksum(self):
+        """An entry without a checksum is an error."""
+        self.manifest['entries'][0]['checksum'] = None
+        with self.assertRaises(ChecksumError):
+            calculate_checksum(self.manifest)
+
+
+class TestChecksumFile(TestCase):
+    def setUp(self):
+        """Start without any remembered checksums."""
+        clear_checksum_cache()
+
+    def test_modified_file(self):
+        """A file is hashed again if it is changed."""
+        with tempfile.NamedTemporaryFile() as f:
+            f.write(b'first content')
+            f.flush()
+            with open(f.name, 'rb') as stream:
+                self.assertEqual(calculate_checksum(stream),
+                                 checksum_raw(b'first content'))
+            f.write(b' and more')
+            f.flush()
+            with open(f.name, 'rb') as stream:
+                self.assertEqual(calculate_checksum(stream),
+                                 checksum_raw(b'first content and more'))
+
+    def test_corrupted_in_place(self):
+        """A file that keeps its size and mtime is read again to verify it."""
+        with tempfile.NamedTemporaryFile() as f:
+            f.write(b'first content')
+            f.flush()
+            stat = os.stat(f.name)
+            with open(f.name, 'rb') as stream:
+                self.assertEqual(calculate_checksum(stream),
+                                 checksum_raw(b'first content'))
+            f.seek(0)
+            f.write(b'FIRST')
+            f.flush()
+            os.utime(f.name, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            with open(f.name, 'rb') as stream:
+                self.assertEqual(calculate_checksum(stream, use_cache=False),
+                                 checksum_raw(b'FIRST content'))
+
+    def test_file_matches_raw(self):
+        """The checksum of a file on disk is that of its content."""
+        content = os.urandom(3 * 1024 * 1024 + 17)
+        with tempfile.NamedTemporaryFile() as f:
+            f.write(content)
+            f.flush()
+            with open(f.name, 'rb') as stream:
+                stream.read(10)
+                self.assertEqual(calculate_checksum(stream),
+                                 checksum_raw(content))
+                self.assertEqual(stream.tell(), 0, 'Stream is rewound')
+
+    def test_empty_file(self):
+        """Empty files can't be mapped, but still have a checksum."""
+        with tempfile.NamedTemporaryFile() as f:
+            with open(f.name, 'rb') as stream:
+                self.assertEqual(calculate_checksum(stream),
+                                 checksum_raw(b''))
+
+
+class TestVerifyPath(TestCase):
+    def setUp(self):
+        """We have a two-level hierarchy of manifests."""
+        self.leaf_checksum = checksum_raw(b'leaf content')
+        self.child = {
+            'entries': [{'key': 'leaf', 'checksum': self.leaf_checksum},
+                        {'key': 'other', 'checksum': checksum_raw(b'other')}],
+            'number_of_events': 0,
+            'number_of_events_by_type': {},
+            'number_of_versions': 0
+        }
+        self.parent = {
+            'entries': [{'key': 'child',
+                         'checksum': calculate_checksum(self.child)}],
+            'number_of_events': 0,
+            'number_of_events_by_type': {},
+            'number_of_versions': 0
+        }
+        self.checksum = calculate_checksum(self.parent)
+
+    def test_valid(self):
+        """A member that is consistent with the hierarchy is verified."""
+        self.assertTrue(verify_path(self.checksum, [self.parent, self.child],
+                                    ['child', 'leaf'], self.leaf_checksum))
+
+    def test_modified_leaf(self):
+        """A member with the wrong checksum is not verified."""
+        self.assertFalse(verify_path(self.checksum, [self.parent, self.child],
+                                     ['child', 'leaf'],
+                                     checksum_raw(b'modified')))
+
+    def test_modified_manifest(self):
+        """A manifest that doesn't match its parent is not verified."""
+        self.child['entries'][1]['checksum'] = checksum_raw(b'modified')
+        self.assertFalse(verify_path(self.checksum, [self.parent, self.child],
+                                     ['child', 'leaf'], self.leaf_checksum))
+
+    def test_missing_key(self):
+        """A member that isn't in the manifest is not verified."""
+        self.assertFalse(verify_path(self.checksum, [self.parent, self.child],
+                                     ['child', 'nope'], self.leaf_checksum))
@@ -0,0 +1,220 @@
+"""Tests for :mod:`arxiv.canonical.integrity.core`."""
+
+import gc
+import io
+import weakref
+from datetime import date, datetime
+from unittest import TestCase, mock
+
+from ...manifest import make_empty_manifest
+from .. import core
+from ..checksum import checksum_raw
+from ..core import IntegrityEntry, R
+from ..version import IntegrityDay, IntegrityEPrint, IntegrityMonth, \
+    IntegrityVersion, D
+
+
+class TestMakeManifest(TestCase):
+    def test_totals(self):
+        """Totals are aggregated over the member manifests."""
+        members = {}
+        for day, n_events, n_versions in [(1, 2, 3), (2, 5, 7)]:
+            manifest = make_empty_manifest()
+            manifest['number_of_events'] = n_events
+            manifest['number_of_versions'] = n_versions
+            manifest['number_of_events_by_type'] = {
+                D.EventType.NEW: n_events - 1,
+                D.EventType.CROSSLIST: 1
+            }
+            members[date(2029, 1, day)] = IntegrityDay(
+                date(2029, 1, day),
+                manifest=manifest,
+                checksum=f'checksum{day}'
+            )
+        manifest = IntegrityMonth.make_manifest(members)
+        self.assertEqual(len(manifest['entries']), 2)
+        self.assertEqual(manifest['number_of_events'], 7)
+        self.assertEqual(manifest['number_of_versions'], 10)
+        self.assertEqual(manifest['number_of_events_by_type'][D.EventType.NEW],
+                         5)
+        self.assertEqual(
+            manifest['number_of_events_by_type'][D.EventType.CROSSLIST], 2
+        )
+        self.assertEqual(
+            manifest['number_of_events_by_type'][D.EventType.REPLACED], 0
+        )
+
+
+class TestManifestName(TestCase):
+    def test_month(self):
+        """Months are named by year and zero-padded month."""
+        self.assertEqual(IntegrityMonth((2029, 1)).manifest_name, '2029-01')
+        self.assertEqual(IntegrityMonth((2029, 12)).manifest_name, '2029-12')
+
+
+class TestUpdateOrExtendManifest(TestCase):
+    def setUp(self):
+        """We have an e-print integrity collection with an empty manifest."""
+        self.integrity = IntegrityEPrint(D.Identifier('2901.00345'),
+                                         manifest=make_empty_manifest())
+
+    def version(self, identifier: str, checksum: str) -> IntegrityVersion:
+        return IntegrityVersion(D.VersionedIdentifier(identifier),
+                                checksum=checksum)
+
+    def test_extend_then_update(self):
+        """Entries are added once, and updated thereafter."""
+        self.integrity.update_or_extend_manifest(
+            self.version('2901.00345v1', 'foo'), 'foo'
+        )
+        self.integrity.update_or_extend_manifest(
+            self.version('2901.00345v2', 'bar'), 'bar'
+        )
+        self.integrity.update_or_extend_manifest(
+            self.version('2901.00345v1', 'baz'), 'baz'
+        )
+        self.assertEqual(
+            [(e['key'], e['checksum'])
+             for e in self.integrity.manifest['entries']],
+            [('2901.00345v1', 'baz'), ('2901.00345v2', 'bar')]
+        )
+
+    def test_refresh_checksum(self):
+        """The checksum is only recalculated if an entry changed."""
+        self.integrity.update_or_extend_manifest(
+            self.version('2901.00345v1', 'foo'), 'foo'
+        )
+        self.integrity.refresh_checksum()
+        checksum = self.integrity.checksum
+        with mock.patch.object(type(self.integrity), 'calculate_checksum') \
+                as mock_calculate:
+            self.integrity.update_or_extend_manifest(
+                self.version('2901.00345v1', 'foo'), 'foo'
+            )
+            self.integrity.refresh_checksum()
+            self.assertEqual(mock_calculate.call_count, 0)
+        self.integrity.update_or_extend_manifest(
+            self.version('2901.00345v1', 'bar'), 'bar'
+        )
+        self.integrity.refresh_checksum()
+        self.assertNotEqual(self.integrity.checksum, checksum)
+
+    def test_refresh_stale_loaded_checksum(self):
+        """A checksum from the caller is replaced if it is out of date."""
+        integrity = IntegrityEPrint(D.Identifier('2901.00345'),
+                                    manifest=make_empty_manifest(),
+                                    checksum='not the checksum')
+        integrity.refresh_checksum()
+        self.assertEqual(integrity.checksum, integrity.calculate_checksum())
+        self.assertTrue(integrity.is_valid)
+
+    def test_update_loaded_manifest(self):
+        """Entries that were already in the manifest are found."""
+        self.integrity.manifest['entries'].append(
+            {'key': '2901.00345v1', 'checksum': 'foo'}
+        )
+        self.integrity.update_or_extend_manifest(
+            self.version('2901.00345v1', 'baz'), 'baz'
+        )
+        self.assertEqual(len(self.integrity.manifest['entries']), 1)
+        self.assertEqual(self.integrity.manifest['entries'][0]['checksum'],
+                         'baz')
+
+
+class TestExtendManifest(TestCase):
+    def test_events_by_type(self):
+        """Event counts by type are added to the manifest."""
+        integrity = IntegrityMonth((2029, 1), manifest=make_empty_manifest())
+        for day in (1, 2):
+            manifest = make_empty_manifest()
+            manifest['number_of_events'] = 1
+            manifest['number_of_events_by_type'] = {D.EventType.NEW: 1}
+            integrity.extend_manifest(
+                IntegrityDay(date(2029, 1, day), manifest=manifest,
+                             checksum=f'checksum{day}')
+            )
+        self.assertEqual(integrity.manifest['number_of_events'], 2)
+        self.assertEqual(integrity.manifest['number_of_events_by_type'],
+                         {D.EventType.NEW: 2})
+
+    def test_checksum(self):
+        """The checksum reflects all of the members that were added."""
+        integrity = IntegrityMonth((2029, 1), manifest=make_empty_manifest())
+        for day in (1, 2, 3):
+            integrity.extend_manifest(
+                IntegrityDay(date(2029, 1, day),
+                             manifest=make_empty_manifest(),
+                             checksum=f'checksum{day}')
+            )
+        self.assertEqual(integrity.checksum, integrity.calculate_checksum())
+        self.assertTrue(integrity.is_valid)
+
+
+class TestIsValid(TestCase):
+    def test_is_valid(self):
+        """The checksum is checked against the manifest."""
+        manifest = make_empty_manifest()
+        manifest['entries'].append({'key': '2029-01-01', 'checksum': 'foo'})
+        integrity = IntegrityMonth((2029, 1), manifest=manifest,
+                                   checksum='not the checksum')
+        self.assertFalse(integrity.is_valid)
+        integrity.update_checksum()
+        self.assertTrue(integrity.is_valid)
+
+
+class TestIntegrityEntry(TestCase):
+    def setUp(self):
+        """We have an entry with some content."""
+        cf = D.CanonicalFile(modified=datetime(2029, 1, 29),
+                             size_bytes=12,
+                             content_type=D.ContentType.pdf,
+                             ref=D.URI('/foo/bar.pdf'),
+                             filename='bar.pdf')
+        self.record = R.RecordEntry(
+            key=D.Key('foo/bar.pdf'),
+            stream=R.RecordStream(domain=cf,
+                                  content=io.BytesIO(b'some content'),
+                                  content_type=D.ContentType.pdf,
+                                  size_bytes=12),
+            domain=cf
+        )
+        self.integrity = IntegrityEntry.from_record(self.record)
+
+    def test_calculate_checksum(self):
+        """The content is only hashed again if the stream is replaced."""
+        with mock.patch(f'{core.__name__}.calculate_checksum',
+                        return_value=checksum_raw(b'some content')) \
+                as mock_calculate:
+            self.integrity.calculate_checksum()
+            self.integrity.calculate_checksum()
+            self.assertEqual(mock_calculate.call_count, 1)
+        self.record.stream = self.record.stream._replace(
+            content=io.BytesIO(b'other content')
+        )
+        self.assertEqual(self.integrity.calculate_checksum(),
+                         checksum_raw(b'other content'))
+
+    def test_invalidate_checksum(self):
+        """Changes to the content in place are seen after invalidation."""
+        self.integrity.calculate_checksum()
+        self.record.stream.content.write(b'other content')
+        self.integrity.invalidate_checksum()
+        self.assertEqual(self.integrity.calculate_checksum(),
+                         checksum_raw(b'other content'))
+
+    def test_is_valid(self):
+        """Verification always reads the content again."""
+        self.assertTrue(self.integrity.is_valid)
+        self.record.stream.content.write(b'other content')
+        self.assertFalse(self.integrity.is_valid)
+
+    def test_replaced_content_is_freed(self):
+        """Content that the record let go of is not kept alive."""
+        self.assertTrue(self.integrity.is_valid)
+        content = weakref.ref(self.record.stream.content)
+        self.record.stream = self.record.stream._replace(
+            content=io.BytesIO(b'some content')
+        )
+        gc.collect()
+        self.assertIsNone(content())
+        self.assertTrue(self.integrity.is_valid)
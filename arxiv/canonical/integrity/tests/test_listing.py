@@ -0,0 +1,34 @@
+"""Tests for :mod:`arxiv.canonical.integrity.listing`."""
+
+from datetime import date
+from unittest import TestCase
+
+from ..checksum import calculate_checksum
+from ..listing import IntegrityListingDay, D, R
+
+
+class TestIntegrityListingDay(TestCase):
+    def setUp(self):
+        """We have a day with several listings."""
+        self.date = date(2029, 1, 29)
+        listings = {}
+        for name in ('foo', 'bar', 'baz', 'bat', 'qux'):
+            identifier = D.ListingIdentifier.from_parts(self.date, name)
+            listings[identifier] = D.Listing(identifier, events=[])
+        self.record = R.RecordListingDay(
+            self.date,
+            members={identifier: R.RecordListing.from_domain(listing)
+                     for identifier, listing in listings.items()},
+            domain=D.ListingDay(self.date, listings=listings)
+        )
+
+    def test_member_checksums(self):
+        """Each listing gets the checksum of its own content."""
+        integrity = IntegrityListingDay.from_record(self.record)
+        self.assertEqual(list(integrity.members), list(self.record.members))
+        for name, member in integrity.members.items():
+            self.assertEqual(
+                member.checksum,
+                calculate_checksum(self.record.members[name].stream)
+            )
+        self.assertEqual(integrity.checksum, integrity.calculate_checksum())
@@ -106,6 +106,37 @@ class TestIntegrityVersion(TestCase):
         integrity = IntegrityVersion.from_record(self.record)
         self.assertIsNotNone(integrity.checksum)
 
+    def test_checksums_from_manifest(self):
+        """Member checksums can be taken from an existing manifest."""
+        manifest = IntegrityVersion.from_record(self.record).manifest
+        for entry in manifest['entries']:
+            entry['checksum'] = f'from manifest {entry["key"]}'
+        integrity = IntegrityVersion.from_record(self.record,
+                                                 manifest=manifest)
+        self.assertEqual(integrity.source.checksum,
+                         f'from manifest {integrity.source.manifest_name}')
+        self.assertEqual(integrity.render.checksum,
+                         f'from manifest {integrity.render.manifest_name}')
+
+    def test_member_missing_from_manifest(self):
+        """A member that is not in the manifest is a KeyError."""
+        manifest = IntegrityVersion.from_record(self.record).manifest
+        manifest['entries'] = [
+            entry for entry in manifest['entries']
+            if entry['key'] != self.record.source.key
+        ]
+        with self.assertRaises(KeyError):
+            IntegrityVersion.from_record(self.record, manifest=manifest)
+
+    def test_members(self):
+        """The metadata, source and render are available by name."""
+        integrity = IntegrityVersion.from_record(self.record)
+        self.assertIs(integrity.metadata, integrity.members['metadata'])
+        self.assertIs(integrity.source, integrity.members['source'])
+        self.assertIs(integrity.render, integrity.members['render'])
+        del integrity.members['render']
+        self.assertIsNone(integrity.render)
+
 
 class TestIntegrityEPrint(TestCase):
     def setUp(self):
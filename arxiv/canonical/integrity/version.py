@@ -1,12 +1,14 @@
 
 from datetime import date
+from operator import itemgetter
 from typing import Dict, Mapping, Optional, Type, Union
 
-from ..manifest import ManifestEntry, Manifest, checksum_from_manifest
+from ..manifest import ManifestEntry, Manifest, index_manifest
 
 from .core import (IntegrityBase, IntegrityEntryBase, IntegrityEntryMembers,
                    IntegrityEntry, D, R, _Self, Year, Month, YearMonth,
                    calculate_checksum, GenericMonoDict)
+from .checksum import calculate_checksums
 from .metadata import IntegrityMetadata
 
 _VersionMember = Union[IntegrityEntry, IntegrityMetadata]
@@ -27,6 +29,8 @@ class IntegrityVersion(IntegrityBase[D.VersionedIdentifier,
                                      _VersionMember]):
     """Integrity collection for an e-print version."""
 
+    __slots__ = ()
+
     @classmethod
     def from_record(cls: Type[_Self], version: R.RecordVersion,
                     checksum: Optional[str] = None,
@@ -52,54 +56,46 @@ class IntegrityVersion(IntegrityBase[D.VersionedIdentifier,
         :class:`.IntegrityVersion`
 
         """
-        calculate_new_checksum_for_members = bool(manifest is None)
-        render_checksum: Optional[str] = None
-        source_checksum: Optional[str] = None
-        format_checksums: Dict[D.ContentType, Optional[str]] = {}
+        entries: Dict[str, R.RecordEntry] = {'source': version.source}
+        entries.update((fmt.value, cf) for fmt, cf in version.formats.items())
+        if version.render:
+            entries['render'] = version.render
+
+        checksums: Dict[str, Optional[str]]
         if manifest:
-            source_checksum = checksum_from_manifest(
-                manifest,
-                R.RecordVersion.make_key(
-                    version.identifier,
-                    version.source.domain.filename
-                )
-            )
-            format_checksums = {
-                fmt: checksum_from_manifest(
-                    manifest,
+            # Look the member checksums up by key in one go, rather than
+            # searching the manifest for each of them. A member that is
+            # missing from the manifest is a KeyError.
+            manifest_checksums = index_manifest(manifest)
+            checksums = {
+                name: manifest_checksums[
                     R.RecordVersion.make_key(version.identifier,
-                                             cf.domain.filename)
-                ) for fmt, cf in version.formats.items()
+                                             entry.domain.filename)
+                ] for name, entry in entries.items()
             }
-            if version.render:
-                render_checksum = checksum_from_manifest(
-                    manifest,
-                    R.RecordVersion.make_key(
-                        version.identifier,
-                        version.render.domain.filename
-                    )
-                )
-        formats = {
-            fmt.value: IntegrityEntry.from_record(
-                cf,
-                checksum=format_checksums.get(fmt),
-                calculate_new_checksum=calculate_new_checksum_for_members
-            ) for fmt, cf in version.formats.items()
-        }
-        if version.render:
-            formats['render'] = IntegrityEntry.from_record(
-                version.render,
-                checksum=render_checksum,
-                calculate_new_checksum=calculate_new_checksum_for_members
+            metadata_checksum = calculate_checksum(version.metadata.stream)
+        else:
+            # The member streams are independent, so they are hashed
+            # together.
+            *new_checksums, metadata_checksum = calculate_checksums(
+                [entry.stream for entry in entries.values()]
+                + [version.metadata.stream]
             )
+            checksums = dict(zip(entries, new_checksums))
+
         members = IntegrityVersionMembers(
-            metadata=IntegrityMetadata.from_record(version.metadata),
-            source=IntegrityEntry.from_record(
-                version.source,
-                checksum=source_checksum,
-                calculate_new_checksum=calculate_new_checksum_for_members
+            metadata=IntegrityMetadata.from_record(
+                version.metadata,
+                checksum=metadata_checksum,
+                calculate_new_checksum=False
             ),
-            **formats
+            **{
+                name: IntegrityEntry.from_record(
+                    entry,
+                    checksum=checksums[name],
+                    calculate_new_checksum=False
+                ) for name, entry in entries.items()
+            }
         )
         manifest = cls.make_manifest(members)
         if calculate_new_checksum:
@@ -110,38 +106,44 @@ class IntegrityVersion(IntegrityBase[D.VersionedIdentifier,
     @classmethod
     def make_manifest(cls, members: Mapping[str, _VersionMember]) -> Manifest:
         """Make a :class:`.Manifest` for this integrity collection."""
-        return Manifest(
-            entries=[cls.make_manifest_entry(members[n]) for n in members],
-            number_of_events=0,
-            number_of_events_by_type={},
-            number_of_versions=1
-        )
+        return {
+            'entries': sorted((cls.make_manifest_entry(member)
+                               for member in members.values()),
+                              key=itemgetter('key')),
+            'number_of_events': 0,
+            'number_of_events_by_type': {},
+            'number_of_versions': 1
+        }
 
     @classmethod
     def make_manifest_entry(cls, member: _VersionMember) -> ManifestEntry:
-        return ManifestEntry(
-            key=member.manifest_name,
-            checksum=member.checksum,
-            size_bytes=member.record.stream.size_bytes,
-            mime_type=member.record.stream.content_type.mime_type
-        )
+        return {
+            'key': member.manifest_name,
+            'checksum': member.checksum,
+            'size_bytes': member.record.stream.size_bytes,
+            'mime_type': member.record.stream.content_type.mime_type
+        }
+
+    # Each accessor looks its member up once; the members mapping also holds
+    # the formats, under their content types, so it stays a dict.
 
     @property
     def metadata(self) -> IntegrityMetadata:
-        assert isinstance(self.members['metadata'], IntegrityMetadata)
-        return self.members['metadata']
+        member = self.members['metadata']
+        assert isinstance(member, IntegrityMetadata)
+        return member
 
     @property
     def render(self) -> Optional[IntegrityEntry]:
-        if 'render' in self.members:
-            assert isinstance(self.members['render'], IntegrityEntry)
-            return self.members['render']
-        return None
+        member = self.members.get('render')
+        assert member is None or isinstance(member, IntegrityEntry)
+        return member
 
     @property
     def source(self) -> IntegrityEntry:
-        assert isinstance(self.members['source'], IntegrityEntry)
-        return self.members['source']
+        member = self.members['source']
+        assert isinstance(member, IntegrityEntry)
+        return member
 
     @property
     def formats(self) -> Dict[D.ContentType, IntegrityEntry]:
@@ -156,15 +158,17 @@ class IntegrityEPrint(IntegrityBase[D.Identifier,
                                     IntegrityVersion]):
     """Integrity collection for an :class:`.EPrint`."""
 
+    __slots__ = ()
+
     member_type = IntegrityVersion
 
     @classmethod
     def make_manifest_entry(cls, member: IntegrityVersion) -> ManifestEntry:
-        return ManifestEntry(key=member.manifest_name,
-                             checksum=member.checksum,
-                             number_of_versions=1,
-                             number_of_events=0,
-                             number_of_events_by_type={})
+        return {'key': member.manifest_name,
+                'checksum': member.checksum,
+                'number_of_versions': 1,
+                'number_of_events': 0,
+                'number_of_events_by_type': {}}
 
 
 class IntegrityDay(IntegrityBase[date,
@@ -178,6 +182,8 @@ class IntegrityDay(IntegrityBase[date,
     which was announced on this day.
     """
 
+    __slots__ = ()
+
     @property
     def day(self) -> date:
         """The numeric day represented by this collection."""
@@ -195,10 +201,11 @@ class IntegrityMonth(IntegrityBase[YearMonth,
     which was announced in this month.
     """
 
-    @property
-    def manifest_name(self) -> str:
+    __slots__ = ()
+
+    def make_manifest_name(self) -> str:
         """The name to use for this record in a parent manifest."""
-        return f'{self.year}-{str(self.month).zfill(2)}'
+        return f'{self.year}-{self.month:02d}'
 
     @property
     def month(self) -> Month:
@@ -222,6 +229,8 @@ class IntegrityYear(IntegrityBase[Year,
     which was announced in this year.
     """
 
+    __slots__ = ()
+
     @property
     def year(self) -> Year:
         """The numeric year represented by this collection."""
@@ -232,4 +241,6 @@ class IntegrityEPrints(IntegrityBase[str,
                                      R.RecordEPrints,
                                      Year,
                                      IntegrityYear]):
-    """Integrity collection for all e-prints in the canonical record."""
\ No newline at end of file
+    """Integrity collection for all e-prints in the canonical record."""
+
+    __slots__ = ()
@@ -1,12 +1,17 @@
 """Defines the structure of manifest records, used to store integrity info."""
 
 import json
+import sys
 from enum import Enum
 from typing import Optional, List, Dict, Any
 from mypy_extensions import TypedDict
 
 from .domain.version import EventType
 
+_EVENT_TYPES_BY_VALUE: Dict[str, EventType] = {
+    event_type.value: event_type for event_type in EventType
+}
+
 
 class ManifestEntry(TypedDict, total=False):
     """Structure of a single entry in a manifest."""
@@ -30,53 +35,104 @@ class Manifest(TypedDict):
 
 
 class ManifestEncoder(json.JSONEncoder):
-    """JSON encoder for manifests."""
+    """
+    JSON encoder for manifests.
 
-    def unpack(self, obj: Any) -> Any:
-        """Convert manifests and their members to native Python types."""
+    Enum values are handled by :meth:`default`, so the rest of the manifest is
+    left to the (C) encoder. Only event counts by type, which are keyed by
+    :class:`.EventType`, need to be converted up front, since JSON keys must
+    be strings.
+    """
+
+    def default(self, obj: Any) -> Any:  # pylint: disable=method-hidden
+        """Serialize enums by value."""
         if isinstance(obj, Enum):
             return obj.value
-        elif isinstance(obj, dict):
-            return {self.unpack(key): self.unpack(value)
-                    for key, value in obj.items()}
-        elif isinstance(obj, list):
-            return [self.unpack(item) for item in obj]
-        return obj
+        return super(ManifestEncoder, self).default(obj)
 
-    def encode(self, obj: Any) -> Any:
+    def iterencode(self, obj: Any, _one_shot: bool = False) -> Any:
         """Serialize manifest objects."""
-        return super(ManifestEncoder, self).encode(self.unpack(obj))
+        return super(ManifestEncoder, self).iterencode(self.unpack(obj),
+                                                       _one_shot)
 
+    def unpack(self, obj: Any) -> Any:
+        """Convert the keys of event counts in a manifest (or entry) to str."""
+        if not isinstance(obj, dict):
+            return obj
+        by_type = obj.get('number_of_events_by_type')
+        entries = obj.get('entries')
+        if by_type is None and entries is None:
+            return obj
+        obj = dict(obj)
+        if by_type is not None:
+            obj['number_of_events_by_type'] = {
+                getattr(key, 'value', key): value
+                for key, value in by_type.items()
+            }
+        if isinstance(entries, list):
+            obj['entries'] = [self.unpack(entry) for entry in entries]
+        return obj
 
-class ManifestDecoder(json.JSONDecoder):
-    """JSON decoder for manifests."""
-
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        """Pass :func:`object_hook` to the base constructor."""
-        kwargs['object_hook'] = kwargs.get('object_hook', self.object_hook)
-        super(ManifestDecoder, self).__init__(*args, **kwargs)
 
-    def object_hook(self, obj: dict, **extra: Any) -> Any:  # pylint: disable=method-hidden
-        """Decode the manifest to domain types."""
-        if 'number_of_events_by_type' in obj:
+class ManifestDecoder(json.JSONDecoder):
+    """
+    JSON decoder for manifests.
+
+    The JSON is decoded as it is (by the C decoder), and the manifest is then
+    converted to domain types in a single pass over it and its entries, rather
+    than calling back into Python for every object along the way.
+    """
+
+    def decode(self, s: str) -> Any:
+        """Decode a manifest."""
+        decoded = super(ManifestDecoder, self).decode(s)
+        return self.pack(decoded)
+
+    def pack(self, obj: Any) -> Any:
+        """Convert a decoded manifest (or entry) to domain types, in place."""
+        if not isinstance(obj, dict):
+            return obj
+        by_type = obj.get('number_of_events_by_type')
+        if by_type is not None:
             obj['number_of_events_by_type'] = {
-                EventType(key): value
-                for key, value in obj['number_of_events_by_type'].items()
+                _EVENT_TYPES_BY_VALUE.get(key) or EventType(key): value
+                for key, value in by_type.items()
             }
+        # There are only a handful of distinct MIME types, repeated in most
+        # entries; decoded entries share them rather than each holding a copy.
+        mime_type = obj.get('mime_type')
+        if isinstance(mime_type, str):
+            obj['mime_type'] = sys.intern(mime_type)
+        entries = obj.get('entries')
+        if isinstance(entries, list):
+            for entry in entries:
+                self.pack(entry)
         return obj
 
 
 def make_empty_manifest() -> Manifest:
     """Generate a new empty manifest."""
-    return Manifest(entries=[],
-                    number_of_events=0,
-                    number_of_versions=0,
-                    number_of_events_by_type={})
+    return {'entries': [],
+            'number_of_events': 0,
+            'number_of_versions': 0,
+            'number_of_events_by_type': {}}
+
+
+def index_manifest(manifest: Manifest) -> Dict[str, Optional[str]]:
+    """
+    Get the checksums in a manifest, by key.
+
+    Use this rather than :func:`checksum_from_manifest` to look up more than
+    one key in the same manifest.
+    """
+    return {entry['key']: entry.get('checksum')
+            for entry in manifest['entries']}
 
 
 def checksum_from_manifest(manifest: Manifest, key: str) -> Optional[str]:
     """Retrieve a checksum for a key from a manifest."""
-    for entry in manifest['entries']:
-        if entry['key'] == key:
-            return entry['checksum']
-    raise KeyError(f'Not found: {key}')
\ No newline at end of file
+    entry = next((entry for entry in manifest['entries']
+                  if entry['key'] == key), None)
+    if entry is None:
+        raise KeyError(f'Not found: {key}')
+    return entry['checksum']
\ No newline at end of file
@@ -61,12 +61,12 @@ class Record(RecordBase[str,
 
     @property
     def eprints(self) -> RecordEPrints:
-        assert 'eprints' in self.members
-        assert isinstance(self.members['eprints'], RecordEPrints)
-        return self.members['eprints']
+        member = self.members.get('eprints')
+        assert isinstance(member, RecordEPrints)
+        return member
 
     @property
     def listings(self) -> RecordListings:
-        assert 'listings' in self.members
-        assert isinstance(self.members['listings'], RecordListings)
-        return self.members['listings']
\ No newline at end of file
+        member = self.members.get('listings')
+        assert isinstance(member, RecordListings)
+        return member
\ No newline at end of file
@@ -1,7 +1,6 @@
 """Base classes and core concepts for :mod:`arxiv.canonical.record`."""
 
 import datetime
-import os
 from abc import ABC
 from io import BytesIO
 from json import dumps, load
@@ -41,6 +40,9 @@ class RecordEntryMembers(GenericMonoDict[str, 'RecordEntry']):
 
     Consistent with ``Mapping[str, RecordEntry]``.
     """
+
+    __slots__ = ()
+
     def __getitem__(self, key: str) -> 'RecordEntry':
         value = dict.__getitem__(self, key)
         assert isinstance(value, RecordEntry)
@@ -59,6 +61,8 @@ class RecordEntry(Generic[_EDomain]):
     entry (i.e. the application-level interpretation of the stream).
     """
 
+    __slots__ = ('key', 'domain', 'stream')
+
     key: D.Key
     """Full key (path) at which the entry is stored."""
     domain: _EDomain
@@ -72,8 +76,11 @@ class RecordEntry(Generic[_EDomain]):
 
     @property
     def name(self) -> str:
-        fname = os.path.split(self.key)[1]
-        return os.path.splitext(fname)[0]
+        # Same as ``splitext(split(key)[1])[0]``, without going through
+        # :mod:`os.path`; leading dots don't start an extension.
+        fname = self.key.rpartition('/')[2]
+        stem = fname.rpartition('.')[0]
+        return stem if stem.lstrip('.') else fname
 
     @classmethod
     def from_domain(cls: Type[_Self], d: _EDomain) -> _Self:
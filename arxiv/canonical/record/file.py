@@ -2,4 +2,6 @@ from .core import RecordEntry, D
 
 
 class RecordFile(RecordEntry[D.CanonicalFile]):
-    """An entry that is handled as an otherwise-uninterpreted file."""
\ No newline at end of file
+    """An entry that is handled as an otherwise-uninterpreted file."""
+
+    __slots__ = ()
@@ -11,6 +11,8 @@ from .core import RecordBase, RecordEntry, RecordStream, D, _Self, \
 class RecordListing(RecordEntry[D.Listing]):
     """A listing entry."""
 
+    __slots__ = ()
+
     @classmethod
     def from_domain(cls: Type[_Self], listing: D.Listing) -> _Self:
         """Serialize a :class:`.Listing`."""
@@ -40,24 +42,24 @@ class RecordListing(RecordEntry[D.Listing]):
 
     @classmethod
     def make_key(cls, identifier: D.ListingIdentifier) -> D.Key:
-        prefix = cls.make_prefix(identifier.date)
-        value: str = identifier.date.strftime(
-            f'{prefix}/%Y-%m-%d-{identifier.name}.json'
-        )
-        return D.Key(value)
+        date = identifier.date
+        prefix = cls.make_prefix(date)
+        return D.Key(f'{prefix}/{date.year}-{date.month:02d}-{date.day:02d}'
+                     f'-{identifier.name}.json')
 
     @classmethod
     def make_prefix(cls, date: datetime.date) -> str:
-        return date.strftime(f'announcement/%Y/%m/%d')
+        # Formatting the fields directly is a lot cheaper than strftime().
+        return f'announcement/{date.year}/{date.month:02d}/{date.day:02d}'
 
     @classmethod
     def to_domain(cls, stream: RecordStream) -> D.Listing:
         assert stream.content is not None
-        listing = D.Listing.from_dict(load(stream.content),
-                                      )
-        if stream.content.seekable:
-            stream.content.seek(0)
-        return listing
+        try:
+            return D.Listing.from_dict(load(stream.content))
+        finally:    # Leave the stream ready for the next reader.
+            if stream.content.seekable():
+                stream.content.seek(0)
 
     @classmethod
     def _encode(cls, listing: D.Listing) -> Tuple[IO[bytes], int]:
@@ -80,7 +82,9 @@ class RecordListingDay(RecordBase[datetime.date,
 
     @classmethod
     def make_manifest_key(cls, date: datetime.date) -> D.Key:
-        return D.Key(date.strftime('announcement/%Y/%m/%Y-%m-%d.manifest.json'))
+        return D.Key(f'announcement/{date.year}/{date.month:02d}/'
+                     f'{date.year}-{date.month:02d}-{date.day:02d}'
+                     '.manifest.json')
 
 
 class RecordListingMonth(RecordBase[YearMonth,
@@ -98,7 +102,7 @@ class RecordListingMonth(RecordBase[YearMonth,
 
         """
         yr, month = year_and_month
-        return D.Key(f'announcement/{yr}/{yr}-{str(month).zfill(2)}.manifest.json')
+        return D.Key(f'announcement/{yr}/{yr}-{month:02d}.manifest.json')
 
 
 class RecordListingYear(RecordBase[Year,
@@ -1,4 +1,5 @@
 import datetime
+from functools import lru_cache
 from io import BytesIO
 from json import dumps, load
 from typing import Type, IO, Iterable, Tuple
@@ -6,16 +7,35 @@ from typing import Type, IO, Iterable, Tuple
 from .core import RecordEntry, RecordStream, D, _Self
 
 
+# Keys for the same versions are made over and over again while records and
+# manifests are built, and each one means parsing the identifier; so they
+# are only made once.
+
+@lru_cache(maxsize=65536)
+def _make_key(identifier: D.VersionedIdentifier) -> D.Key:
+    if identifier.is_old_style:
+        filename = f'{identifier.numeric_part}v{identifier.version}.json'
+    else:
+        filename = f'{identifier}.json'
+    return D.Key(f'{_make_prefix(identifier)}/{filename}')
+
+
+@lru_cache(maxsize=65536)
+def _make_prefix(ident: D.VersionedIdentifier) -> str:
+    date_part = f'e-prints/{ident.year}/{ident.month:02d}'
+    if ident.is_old_style:
+        return f'{date_part}/{ident.category_part}/{ident.numeric_part}/v{ident.version}'
+    return f'{date_part}/{ident.arxiv_id}/v{ident.version}'
+
+
 class RecordMetadata(RecordEntry[D.Version]):
     """An entry for version metadata."""
 
+    __slots__ = ()
+
     @classmethod
     def make_key(cls, identifier: D.VersionedIdentifier) -> D.Key:
-        if identifier.is_old_style:
-            filename = f'{identifier.numeric_part}v{identifier.version}.json'
-        else:
-            filename = f'{identifier}.json'
-        return D.Key(f'{cls.make_prefix(identifier)}/{filename}')
+        return _make_key(identifier)
 
     @classmethod
     def make_prefix(cls, ident: D.VersionedIdentifier) -> str:
@@ -34,10 +54,7 @@ class RecordMetadata(RecordEntry[D.Version]):
         str
 
         """
-        date_part = f'e-prints/{ident.year}/{str(ident.month).zfill(2)}'
-        if ident.is_old_style:
-            return f'{date_part}/{ident.category_part}/{ident.numeric_part}/v{ident.version}'
-        return f'{date_part}/{ident.arxiv_id}/v{ident.version}'
+        return _make_prefix(ident)
 
     @classmethod
     def from_domain(cls: Type[_Self], version: D.Version) -> _Self:
@@ -70,11 +87,11 @@ class RecordMetadata(RecordEntry[D.Version]):
     @classmethod
     def to_domain(cls, stream: RecordStream) -> D.Version:
         assert stream.content is not None
-        version = D.Version.from_dict(load(stream.content),
-                                      )
-        if stream.content.seekable:
-            stream.content.seek(0)
-        return version  # RecordVersion.post_to_domain(version, load_content)
+        try:
+            return D.Version.from_dict(load(stream.content))
+        finally:    # Leave the stream ready for the next reader.
+            if stream.content.seekable():
+                stream.content.seek(0)
 
     @classmethod
     def from_stream(cls, key: D.Key, stream: RecordStream) -> 'RecordMetadata':
@@ -103,3 +103,14 @@ class TestRecordListing(TestCase):
         """Re-casting to domain should preserve state."""
         record = RecordListing.from_domain(self.listing)
         self.assertEqual(RecordListing.to_domain(record.stream), self.listing)
+
+    def test_to_domain_rewinds(self):
+        """The stream is rewound after loading, even if loading fails."""
+        record = RecordListing.from_domain(self.listing)
+        RecordListing.to_domain(record.stream)
+        self.assertEqual(record.stream.content.tell(), 0)
+
+        stream = record.stream._replace(content=io.BytesIO(b'{"foo": 1}'))
+        with self.assertRaises(KeyError):
+            RecordListing.to_domain(stream)
+        self.assertEqual(stream.content.tell(), 0)
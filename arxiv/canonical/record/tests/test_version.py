@@ -3,7 +3,7 @@ import io
 import json
 import os
 import tempfile
-from datetime import datetime
+from datetime import date, datetime
 from pprint import pprint
 from pytz import UTC
 from typing import IO
@@ -13,7 +13,7 @@ import jsonschema
 
 from ..core import RecordEntry
 from ..metadata import RecordMetadata
-from ..version import RecordVersion, D
+from ..version import RecordDay, RecordMonth, RecordVersion, D
 
 
 def fake_dereferencer(uri: D.URI) -> IO[bytes]:
@@ -122,3 +122,72 @@ class TestRecordVersion(TestCase):
             self.assertEqual(getattr(cast_version, key),
                              getattr(self.version, key),
                              f'{key} should match')
+
+
+class TestKeys(TestCase):
+    """Keys are made from identifiers."""
+
+    def test_new_style(self):
+        """Keys for new-style identifiers are grouped by year and month."""
+        ident = D.VersionedIdentifier('2901.00345v1')
+        self.assertEqual(
+            RecordVersion.make_key(ident, '2901.00345v1.pdf'),
+            'arxiv:///e-prints/2029/01/2901.00345/v1/2901.00345v1.pdf'
+        )
+        self.assertEqual(
+            RecordVersion.make_key(ident),
+            'arxiv:///e-prints/2029/01/2901.00345/v1/2901.00345v1.json'
+        )
+        self.assertEqual(
+            RecordVersion.make_manifest_key(ident),
+            'arxiv:///e-prints/2029/01/2901.00345/2901.00345v1.manifest.json'
+        )
+
+    def test_old_style(self):
+        """Old-style identifiers are split by category."""
+        ident = D.VersionedIdentifier('cs/0701001v2')
+        self.assertEqual(RecordVersion.make_prefix(ident),
+                         'e-prints/2007/01/cs/0701001/v2')
+        self.assertEqual(
+            RecordMetadata.make_key(ident),
+            'arxiv:///e-prints/2007/01/cs/0701001/v2/0701001v2.json'
+        )
+
+    def test_repeated(self):
+        """The same key is returned for the same identifier."""
+        ident = D.VersionedIdentifier('2901.00345v1')
+        self.assertIs(RecordVersion.make_key(ident, 'foo.pdf'),
+                      RecordVersion.make_key(ident, 'foo.pdf'))
+
+    def test_day_manifest(self):
+        """Daily manifests are named by date."""
+        self.assertEqual(
+            RecordDay.make_manifest_key(date(2029, 1, 2)),
+            'arxiv:///e-prints/2029/01/2029-01-02.manifest.json'
+        )
+
+    def test_month_manifest(self):
+        """Monthly manifests are named by year and zero-padded month."""
+        self.assertEqual(RecordMonth.make_manifest_key((2029, 1)),
+                         'arxiv:///e-prints/2029/2029-01.manifest.json')
+
+
+class TestEntryName(TestCase):
+    """The name of an entry is its filename, less any extension."""
+
+    def name(self, key: str) -> str:
+        return RecordEntry(D.Key(key), stream=None, domain=None).name
+
+    def test_name(self):
+        """Only the last extension is dropped."""
+        self.assertEqual(
+            self.name('e-prints/2029/01/2901.00345/v1/2901.00345v1.json'),
+            '2901.00345v1'
+        )
+        self.assertEqual(self.name('foo/bar.tar.gz'), 'bar.tar')
+
+    def test_no_extension(self):
+        """Names without an extension, or only a leading dot, are kept."""
+        self.assertEqual(self.name('foo/bar'), 'bar')
+        self.assertEqual(self.name('foo/.bar'), '.bar')
+        self.assertEqual(self.name('foo/..bar'), '..bar')
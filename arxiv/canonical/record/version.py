@@ -1,4 +1,5 @@
 import datetime
+from functools import lru_cache
 from typing import Callable, Dict, IO, Iterable, Optional
 
 from .core import RecordBase, RecordEntry, RecordEntryMembers, RecordStream, \
@@ -7,6 +8,27 @@ from .file import RecordFile
 from .metadata import RecordMetadata
 
 
+# Keys are made once per identifier (and filename); see the note in
+# :mod:`.metadata`.
+
+@lru_cache(maxsize=65536)
+def _make_key(identifier: D.VersionedIdentifier, filename: str) -> D.Key:
+    return D.Key(f'{RecordMetadata.make_prefix(identifier)}/{filename}')
+
+
+@lru_cache(maxsize=65536)
+def _make_manifest_key(ident: D.VersionedIdentifier) -> D.Key:
+    date_part = f'e-prints/{ident.year}/{ident.month:02d}'
+    if ident.is_old_style:
+        return D.Key(f'{date_part}/{ident.category_part}/{ident.numeric_part}/{ident.numeric_part}.manifest.json')
+    return D.Key(f'{date_part}/{ident.arxiv_id}/{ident}.manifest.json')
+
+
+@lru_cache(maxsize=65536)
+def _make_eprint_key(idn: D.Identifier) -> D.Key:
+    return D.Key(f'e-prints/{idn.year}/{idn.month:02d}/{idn}')
+
+
 class RecordVersion(RecordBase[D.VersionedIdentifier,
                                str,
                                RecordEntry,
@@ -46,64 +68,41 @@ class RecordVersion(RecordBase[D.VersionedIdentifier,
         if version.announced_date_first is None:
             raise ValueError('First announcement date not set')
 
-        # Dereference the bitstreams, wherever they happen to live.
-        source_content = dereferencer(version.source.ref)
-        format_content = {fmt: dereferencer(cf.ref)
-                          for fmt, cf in version.formats.items()}
-
-        source_key = RecordVersion.make_key(version.identifier,
-                                            version.source.filename)
-        format_keys = {
-            fmt: RecordVersion.make_key(version.identifier, cf.filename)
-            for fmt, cf in version.formats.items()
-        }
-
-        source = RecordFile(
-            key=source_key,
-            stream=RecordStream(
-                domain=version.source,
-                content=source_content,
-                content_type=version.source.content_type,
-                size_bytes=version.source.size_bytes,
-            ),
-            domain=version.source
-        )
-
-        formats = {
-            fmt.value: RecordFile(
-                key=format_keys[fmt],
+        identifier = version.identifier
+        keys: Dict[Optional[str], D.Key] = {}
+
+        def _make_file(cf: D.CanonicalFile) -> RecordFile:
+            # Dereference the bitstream, wherever it happens to live. The
+            # render is usually one of the formats, so keys are reused by
+            # filename.
+            if cf.filename not in keys:
+                keys[cf.filename] = RecordVersion.make_key(identifier,
+                                                           cf.filename)
+            return RecordFile(
+                key=keys[cf.filename],
                 stream=RecordStream(
                     domain=cf,
-                    content=format_content[fmt],
+                    content=dereferencer(cf.ref),
                     content_type=cf.content_type,
                     size_bytes=cf.size_bytes,
                 ),
                 domain=cf
-            ) for fmt, cf in version.formats.items()
-        }
-        if version.render:
-            render_content = dereferencer(version.render.ref)
-            render_key = RecordVersion.make_key(version.identifier,
-                                                version.render.filename)
-            version.render.ref = render_key
-            formats['render'] = RecordFile(
-                key=render_key,
-                stream=RecordStream(
-                    domain=version.render,
-                    content=render_content,
-                    content_type=version.render.content_type,
-                    size_bytes=version.render.size_bytes,
-                ),
-                domain=version.render
             )
 
+        source = _make_file(version.source)
+        formats = {fmt.value: _make_file(cf)
+                   for fmt, cf in version.formats.items()}
+        if version.render:
+            formats['render'] = _make_file(version.render)
+            version.render.ref = formats['render'].key
+
         if metadata is None:
             metadata = RecordMetadata.from_domain(version)
 
         # From now on we refer to bitstreams with canonical URIs.
-        version.source.ref = source_key
+        version.source.ref = source.key
         for fmt, cf in version.formats.items():
-            cf.ref = format_keys[fmt]
+            cf.ref = formats[fmt.value].key
 
         return RecordVersion(
             version.identifier,
@@ -120,14 +119,11 @@ class RecordVersion(RecordBase[D.VersionedIdentifier,
                  filename: Optional[str] = None) -> D.Key:
         if filename is None:
             return RecordMetadata.make_key(identifier)
-        return D.Key(f'{cls.make_prefix(identifier)}/{filename}')
+        return _make_key(identifier, filename)
 
     @classmethod
     def make_manifest_key(cls, ident: D.VersionedIdentifier) -> D.Key:
-        date_part = f'e-prints/{ident.year}/{str(ident.month).zfill(2)}'
-        if ident.is_old_style:
-            return D.Key(f'{date_part}/{ident.category_part}/{ident.numeric_part}/{ident.numeric_part}.manifest.json')
-        return D.Key(f'{date_part}/{ident.arxiv_id}/{ident}.manifest.json')
+        return _make_manifest_key(ident)
 
     @classmethod
     def make_prefix(cls, ident: D.VersionedIdentifier) -> str:
@@ -146,11 +142,7 @@ class RecordVersion(RecordBase[D.VersionedIdentifier,
         str
 
         """
-        date_part = f'e-prints/{ident.year}/{str(ident.month).zfill(2)}'
-        if ident.is_old_style:
-            return (f'{date_part}/{ident.category_part}/{ident.numeric_part}/'
-                    f'v{ident.version}')
-        return f'{date_part}/{ident.arxiv_id}/v{ident.version}'
+        return RecordMetadata.make_prefix(ident)
 
     @property
     def identifier(self) -> D.VersionedIdentifier:
@@ -159,17 +151,14 @@ class RecordVersion(RecordBase[D.VersionedIdentifier,
     @property
     def metadata(self) -> RecordMetadata:
         """JSON document containing canonical e-print metadata."""
-        assert 'metadata' in self.members
-        member = self.members['metadata']
+        member = self.members.get('metadata')
         assert isinstance(member, RecordMetadata)
         return member
 
     @property
     def render(self) -> Optional[RecordEntry]:
         """Canonical PDF for the e-print."""
-        if 'render' in self.members:
-            return self.members['render']
-        return None
+        return self.members.get('render')
 
     @property
     def formats(self) -> Dict[D.ContentType, RecordEntry]:
@@ -180,8 +169,9 @@ class RecordVersion(RecordBase[D.VersionedIdentifier,
     @property
     def source(self) -> RecordEntry:
         """Gzipped tarball containing the e-print source."""
-        assert 'source' in self.members
-        return self.members['source']
+        member = self.members.get('source')
+        assert isinstance(member, RecordEntry)
+        return member
 
     def instance_to_domain(self) -> D.Version:
         """Deserialize an :class:`.RecordVersion` to an :class:`.Version`."""
@@ -210,7 +200,7 @@ class RecordEPrint(RecordBase[D.Identifier,
         str
 
         """
-        return D.Key(f'e-prints/{idn.year}/{str(idn.month).zfill(2)}/{idn}')
+        return _make_eprint_key(idn)
 
     @classmethod
     def make_manifest_key(cls, ident: D.Identifier) -> D.Key:
@@ -239,7 +229,9 @@ class RecordDay(RecordBase[datetime.date,
         str
 
         """
-        return D.Key(date.strftime('e-prints/%Y/%m/%Y-%m-%d.manifest.json'))
+        return D.Key(f'e-prints/{date.year}/{date.month:02d}/'
+                     f'{date.year}-{date.month:02d}-{date.day:02d}'
+                     '.manifest.json')
 
 
 class RecordMonth(RecordBase[YearMonth,
@@ -257,7 +249,7 @@ class RecordMonth(RecordBase[YearMonth,
 
         """
         y, m = year_and_month
-        return D.Key(f'e-prints/{y}/{y}-{str(m).zfill(2)}.manifest.json')
+        return D.Key(f'e-prints/{y}/{y}-{m:02d}.manifest.json')
 
 
 class RecordYear(RecordBase[Year,
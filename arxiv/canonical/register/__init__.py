@@ -14,7 +14,7 @@ from .api import (RegisterAPI, IRegisterAPI, ICanonicalStorage,
                   RegisterListingDay, RegisterListingMonth,
                   RegisterListingYear, RegisterMetadata, RegisterMonth,
                   RegisterVersion, RegisterYear, NoSuchResource,
-                  ConsistencyError)
+                  ConsistencyError, Resolver)
 
 __all__ = (
     'Base',
@@ -36,5 +36,6 @@ __all__ = (
     'RegisterMetadata',
     'RegisterMonth',
     'RegisterVersion',
-    'RegisterYear'
+    'RegisterYear',
+    'Resolver'
 )
\ No newline at end of file
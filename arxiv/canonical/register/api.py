@@ -11,6 +11,7 @@ from typing import (Any, Optional, IO, Iterable, Iterator, Union, Sequence,
 
 from typing_extensions import Protocol, Literal
 
+from ..core import Resolver
 from ..manifest import Manifest
 from .core import (D, R, I, ICanonicalStorage, ICanonicalSource, Base,
                    Year, Month, YearMonth, IStorableEntry, Selector,
@@ -35,8 +36,8 @@ class RegisterAPI(IRegisterAPI):
                  name: str = 'all') -> None:
         """Initialize the API with a storage backend."""
         self._storage = storage
-        self._sources = sources
-        self._register = Register.load(self._storage, sources, name)
+        self._sources = Resolver(sources)
+        self._register = Register.load(self._storage, self._sources, name)
 
     def add_events(self, *events: D.Event) -> None:
         """Add new events to the register."""
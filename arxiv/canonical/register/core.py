@@ -14,7 +14,8 @@ from typing import (Dict, Tuple, Iterator, List,
 from typing_extensions import Literal, Protocol
 
 from ..core import ICanonicalSource, ICanonicalStorage, IManifestStorage, \
-    IStorableEntry, dereference, IRegisterAPI, Year, Month, YearMonth, Selector
+    IStorableEntry, dereference, IRegisterAPI, Year, Month, \
+    YearMonth, Selector
 from .. import domain as D
 from .. import record as R
 from .. import integrity as I
@@ -161,12 +162,21 @@ class Base(Generic[_Name, _Domain, _Record, _Integrity, _MemberName, _Member]):
             self._add_events(s, sources, events, self._member_name)
         )
         assert self.integrity.manifest is not None
-        self.integrity.update_checksum()
+        # Members whose checksums did not change leave the manifest as it
+        # was, in which case there is nothing to re-hash.
+        self.integrity.refresh_checksum()
 
     def iter_members(self) -> Iterable[_Member]:
-        """Get an iterator over members in this register."""
+        """
+        Get an iterator over members in this register.
+
+        Members that weren't already loaded are not kept in :attr:`members`
+        afterwards, so changes should be made via :attr:`members` instead.
+        """
         assert self.members is not None
-        return (self.members[name] for name in self.members)
+        if isinstance(self.members, LazyMap):
+            return self.members.iter_values()
+        return iter(self.members.values())
 
     def save(self, s: ICanonicalStorage) -> str:
         """Store changes to the integrity manifest for this register."""
@@ -0,0 +1,35 @@
+"""Tests for :mod:`arxiv.canonical.register.util`."""
+
+from unittest import TestCase, mock
+
+from ..util import LazyMap
+
+
+class TestLazyMap(TestCase):
+    """LazyMap loads values when they are first accessed."""
+
+    def setUp(self):
+        """We have a map with a few keys."""
+        self.load = mock.MagicMock(side_effect=lambda key: f'value {key}')
+        self.mapping = LazyMap(['a', 'b', 'c'], self.load)
+
+    def test_getitem(self):
+        """Values are loaded once, and kept."""
+        self.assertEqual(self.mapping['a'], 'value a')
+        self.assertEqual(self.mapping['a'], 'value a')
+        self.assertEqual(self.load.call_count, 1)
+
+    def test_iter_values(self):
+        """Values loaded during iteration are not kept."""
+        self.mapping['d'] = 'set d'
+        self.assertEqual(list(self.mapping.iter_values()),
+                         ['value a', 'value b', 'value c', 'set d'])
+        self.assertEqual(self.load.call_count, 3)
+        self.assertEqual(self.mapping['a'], 'value a')
+        self.assertEqual(self.load.call_count, 4)
+
+    def test_iter_values_failed(self):
+        """Values that can't be loaded are missing."""
+        self.load.side_effect = RuntimeError('nope')
+        with self.assertRaises(KeyError):
+            list(self.mapping.iter_values())
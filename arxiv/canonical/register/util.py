@@ -51,6 +51,24 @@ class LazyMap(collections.abc.MutableMapping):
     def __iter__(self) -> Iterator[Any]:
         return iter(self._keys)
 
+    def iter_values(self) -> Iterator[Any]:
+        """
+        Iterate over the values, without keeping the ones that we load.
+
+        Values that were already loaded (or set) are yielded as they are; the
+        rest are loaded on the fly and dropped once the caller moves on, so
+        walking a large collection doesn't hold all of it in memory.
+        """
+        for key in self._keys:
+            if key in self._data:
+                yield self._data[key]
+                continue
+            try:
+                value = self._load(key)
+            except Exception as e:
+                raise KeyError(f'{key} not found or not supported') from e
+            yield value
+
     def __contains__(self, key: Any) -> bool:
         return bool(key in self._keys)
 
@@ -121,7 +121,7 @@ class RegisterVersion(Base[D.VersionedIdentifier,
     @property
     def member_names(self) -> Set[str]:
         assert self.members is not None
-        return set([name for name in self.members])
+        return set(self.members)
 
     @property
     def number_of_events(self) -> int:
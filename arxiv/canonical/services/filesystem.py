@@ -27,6 +27,8 @@ ET = timezone('US/Eastern')
 class Filesystem(ICanonicalSource):
     """Retrieves content from a filesystem (outside the canonical record)."""
 
+    schemes = ('file',)
+
     def __init__(self, base_path: str) -> None:
         self._base_path = base_path
 
@@ -46,6 +48,8 @@ class Filesystem(ICanonicalSource):
 class CanonicalFilesystem(Filesystem, ICanonicalStorage):
     """Filesystem storage for the canonical record."""
 
+    schemes = ('arxiv',)
+
     def can_resolve(self, uri: D.URI) -> bool:
         return uri.is_canonical
 
@@ -12,6 +12,10 @@ from ..register import ICanonicalSource
 from .readable import IterReadWrapper, BytesIOProxy
 
 
+CHUNK_SIZE = 65_536
+"""Number of bytes to request at a time when streaming a response."""
+
+
 class RemoteSource(ICanonicalSource):
     """Retrieves content from remote URIs."""
 
@@ -40,6 +44,11 @@ class RemoteSource(ICanonicalSource):
         self._session.mount('http://', self._adapter)
         self._session.mount('https://', self._adapter)
 
+    @property
+    def schemes(self) -> Tuple[str, ...]:
+        """URI schemes that this source is able to resolve."""
+        return (self._trusted_scheme,)
+
     def can_resolve(self, uri: D.URI) -> bool:
         return self.__can_resolve(uri)
 
@@ -84,7 +93,7 @@ class DeferredRequestReader(io.BytesIO):
             # logger.error('%i: %s', response.status_code, response.headers)
             raise IOError(f'Could not retrieve {self._uri}:'
                           f' {response.status_code}')
-        return IterReadWrapper(response.iter_content)
+        return IterReadWrapper(response.iter_content, size=CHUNK_SIZE)
 
     def read(self, size: Optional[int] = -1) -> bytes:
         """Read from the remote resource."""
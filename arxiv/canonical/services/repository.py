@@ -14,6 +14,11 @@ from .remote import RemoteSource
 class RemoteRepository(RemoteSource):
     """Retrieves content from a remote arXiv repository."""
 
+    @property
+    def schemes(self) -> Tuple[str, ...]:
+        """URI schemes that this source is able to resolve."""
+        return ('arxiv',)
+
     def can_resolve(self, uri: D.URI) -> bool:
         return self.__can_resolve(uri)
 
@@ -9,7 +9,6 @@ import io
 import logging
 import os
 from base64 import urlsafe_b64decode, urlsafe_b64encode
-from binascii import hexlify, unhexlify
 from datetime import datetime, date
 from functools import partial
 from hashlib import md5
@@ -67,6 +66,8 @@ class CanonicalStore(ICanonicalStorage):
     transparently.
     """
 
+    schemes = ('arxiv',)
+
     def __init__(self, bucket: str, verify: bool = False,
                  region_name: Optional[str] = None,
                  endpoint_url: Optional[str] = None,
@@ -143,7 +144,9 @@ class CanonicalStore(ICanonicalStorage):
         # Make sure to decompress the content if necessary.
         if ri.record.stream.domain.is_gzipped:
             body = gzip.GzipFile(fileobj=ri.record.stream.content).read()
-            s3_checksum = _b64_to_hex(I.calculate_checksum(body))
+            # We only need the digest here, so it isn't encoded as a
+            # checksum first.
+            s3_checksum = md5(body).hexdigest()
         else:
             body = ri.record.stream.content.read()
             s3_checksum = _b64_to_hex(ri.checksum)
@@ -206,6 +209,8 @@ class CanonicalStore(ICanonicalStorage):
 
 
 class InMemoryStorage(ICanonicalStorage):
+    schemes = ('arxiv',)
+
     def __init__(self) -> None:
         self._streams: Dict[D.URI, Tuple[R.RecordStream, str]] = {}
         self._manifests: Dict[str, Manifest] = {}
@@ -245,10 +250,10 @@ class InMemoryStorage(ICanonicalStorage):
 
 
 def _b64_to_hex(checksum: Checksum) -> str:
-    return hexlify(urlsafe_b64decode(checksum.encode('utf-8'))).decode('utf-8')
+    return urlsafe_b64decode(checksum).hex()
 
 
 def _hex_to_b64(etag: str) -> Checksum:
     """Convert an hexdigest of an MD5 to a URL-safe base64-encoded digest."""
-    return urlsafe_b64encode(unhexlify(etag)).decode('utf-8')
+    return urlsafe_b64encode(bytes.fromhex(etag)).decode('ascii')
 
@@ -0,0 +1,82 @@
+"""Tests for :mod:`arxiv.canonical.core`."""
+
+import io
+from unittest import TestCase, mock
+
+from .. import domain as D
+from ..core import Resolver, dereference
+
+
+class TestResolver(TestCase):
+    """A :class:`.Resolver` routes URIs to sources by scheme."""
+
+    def setUp(self):
+        """Given some sources, one of which does not advertise schemes."""
+        self.files = mock.MagicMock(schemes=('file',))
+        self.files.can_resolve.return_value = True
+        self.files.load.return_value = io.BytesIO(b'file')
+        self.canonical = mock.MagicMock(schemes=('arxiv',))
+        self.canonical.can_resolve.return_value = True
+        self.canonical.load.return_value = io.BytesIO(b'canonical')
+        self.anything = mock.MagicMock(spec=['can_resolve', 'load'])
+        self.anything.can_resolve.return_value = False
+        self.resolver = Resolver([self.anything, self.files, self.canonical])
+
+    def test_is_a_sequence_of_sources(self):
+        """The resolver can be used in place of the original sources."""
+        self.assertEqual(len(self.resolver), 3)
+        self.assertEqual(list(self.resolver),
+                         [self.anything, self.files, self.canonical])
+
+    def test_dereference(self):
+        """Only sources that advertise the scheme (or none at all) are used."""
+        content = dereference(self.resolver, D.URI('arxiv:///foo/bar'))
+        self.assertEqual(content.read(), b'canonical')
+        self.files.can_resolve.assert_not_called()
+        self.anything.can_resolve.assert_called_once()
+
+    def test_dereference_after_store(self):
+        """A source that can resolve an URI later on is used from then on."""
+        stored = set()
+        storage = mock.MagicMock(spec=['can_resolve', 'load'])
+        storage.can_resolve.side_effect = lambda uri: uri in stored
+        storage.load.side_effect = lambda uri: io.BytesIO(b'stored')
+        fallback = mock.MagicMock(spec=['can_resolve', 'load'])
+        fallback.can_resolve.return_value = True
+        fallback.load.side_effect = lambda uri: io.BytesIO(b'fallback')
+        resolver = Resolver([storage, fallback])
+        uri = D.URI('arxiv:///foo/bar')
+
+        self.assertEqual(dereference(resolver, uri).read(), b'fallback')
+        stored.add(uri)
+        self.assertEqual(dereference(resolver, uri).read(), b'stored')
+
+    def test_cannot_resolve(self):
+        """A :class:`RuntimeError` is raised if no source can resolve."""
+        with self.assertRaises(RuntimeError):
+            self.resolver.dereference(D.URI('https://arxiv.org/foo'))
+
+
+class TestDereferenceBuffering(TestCase):
+    """Unbuffered streams from sources are buffered when dereferenced."""
+
+    def test_raw_stream(self):
+        """A raw stream is wrapped in a buffered reader."""
+        raw = io.FileIO(__file__, 'rb')
+        source = mock.MagicMock(spec=['can_resolve', 'load'])
+        source.can_resolve.return_value = True
+        source.load.return_value = raw
+        content = dereference([source], D.URI(__file__))
+        self.assertIsInstance(content, io.BufferedReader)
+        with open(__file__, 'rb') as f:
+            self.assertEqual(content.read(), f.read())
+        content.close()
+
+    def test_buffered_stream(self):
+        """A stream that is already buffered is returned as-is."""
+        buffered = io.BytesIO(b'foo')
+        source = mock.MagicMock(spec=['can_resolve', 'load'])
+        source.can_resolve.return_value = True
+        source.load.return_value = buffered
+        self.assertIs(dereference(Resolver([source]), D.URI('/foo')),
+                      buffered)
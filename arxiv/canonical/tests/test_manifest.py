@@ -0,0 +1,77 @@
+"""Tests for :mod:`arxiv.canonical.manifest`."""
+
+import json
+from unittest import TestCase
+
+from ..domain import EventType
+from ..manifest import ManifestDecoder, ManifestEncoder, checksum_from_manifest
+
+
+class TestManifestEncoder(TestCase):
+    def test_round_trip(self):
+        """Manifests with event counts by type survive serialization."""
+        manifest = {
+            'entries': [{'key': '2029-01-01', 'checksum': 'asdf',
+                         'number_of_events': 2,
+                         'number_of_events_by_type': {EventType.NEW: 1,
+                                                      EventType.REPLACED: 1},
+                         'number_of_versions': 1},
+                        {'key': 'foo.pdf', 'checksum': 'qwer',
+                         'mime_type': 'application/pdf'}],
+            'number_of_events': 2,
+            'number_of_events_by_type': {EventType.NEW: 1,
+                                         EventType.REPLACED: 1},
+            'number_of_versions': 1
+        }
+        encoded = json.dumps(manifest, cls=ManifestEncoder)
+        self.assertIn('"new": 1', encoded)
+        self.assertEqual(json.loads(encoded, cls=ManifestDecoder), manifest)
+
+    def test_enum_values(self):
+        """Enums elsewhere in a manifest are serialized by value."""
+        self.assertEqual(
+            json.dumps({'type': EventType.NEW}, cls=ManifestEncoder),
+            '{"type": "new"}'
+        )
+
+    def test_unsupported(self):
+        """Other objects still can't be serialized."""
+        with self.assertRaises(TypeError):
+            json.dumps({'foo': object()}, cls=ManifestEncoder)
+
+
+class TestManifestDecoder(TestCase):
+    def test_mime_types_are_shared(self):
+        """Entries with the same MIME type share a single string."""
+        manifest = json.loads(json.dumps({
+            'entries': [{'key': f'foo{i}.pdf', 'checksum': 'asdf',
+                         'mime_type': 'application/pdf'} for i in range(2)],
+            'number_of_events': 0,
+            'number_of_events_by_type': {'new': 0},
+            'number_of_versions': 0
+        }), cls=ManifestDecoder)
+        first, second = manifest['entries']
+        self.assertEqual(first['mime_type'], 'application/pdf')
+        self.assertIs(first['mime_type'], second['mime_type'])
+
+
+class TestChecksumFromManifest(TestCase):
+    def setUp(self):
+        """We have a manifest with a couple of entries."""
+        self.manifest = {
+            'entries': [{'key': 'foo', 'checksum': 'asdf'},
+                        {'key': 'bar', 'checksum': None}],
+            'number_of_events': 0,
+            'number_of_events_by_type': {},
+            'number_of_versions': 0
+        }
+
+    def test_found(self):
+        """The checksum of the entry with the key is returned."""
+        self.assertEqual(checksum_from_manifest(self.manifest, 'foo'), 'asdf')
+        self.assertIsNone(checksum_from_manifest(self.manifest, 'bar'))
+
+    def test_not_found(self):
+        """A key that isn't in the manifest is a KeyError."""
+        with self.assertRaises(KeyError):
+            checksum_from_manifest(self.manifest, 'baz')
@@ -9,4 +9,6 @@ ValueType = TypeVar('ValueType')
 class GenericMonoDict(Dict[KeyType, ValueType]):
     """A dict with specific key and value types."""
 
+    __slots__ = ()
+
     def __getitem__(self, key: KeyType) -> ValueType: ...
\ No newline at end of file